@@ -1,222 +1,1669 @@
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-from typing import Dict, List, Tuple
+import copy
+import itertools
+import math
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Union
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for better looking plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+_plot_modules = None
+
+def _plotting(backend: Optional[str] = None) -> Tuple[Any, Any]:
+    """
+    Import matplotlib and seaborn on first use and apply the plot style
+    
+    The plotting stack is the bulk of this module's import cost, so it is
+    only loaded once something is drawn.
+    
+    Args:
+        backend (str): Matplotlib backend to select first (e.g. ``'Agg'``)
+    
+    Returns:
+        Tuple[Any, Any]: (matplotlib.pyplot, seaborn)
+    """
+    global _plot_modules
+    if backend is not None:
+        import matplotlib
+        matplotlib.use(backend)
+    if _plot_modules is None:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        # Set style for better looking plots
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _plot_modules = (plt, sns)
+    return _plot_modules
+
+def iter_file_chunks(path: str, chunksize: int = 100_000,
+                     columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream a CSV or Parquet file as a sequence of DataFrame chunks
+    
+    Args:
+        path (str): CSV file, Parquet file (``.parquet`` / ``.pq``), or a
+            directory of such shards (read in name order)
+        chunksize (int): Rows per chunk (Parquet batches never span row groups)
+        columns (List[str]): Columns to read; all columns if omitted
+    
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(('.parquet', '.pq', '.csv')):
+                yield from iter_file_chunks(os.path.join(path, name), chunksize, columns)
+        return
+    if str(path).endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, usecols=columns)
+
+def _is_string_column(column: pd.Series) -> bool:
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return False
+    if pd.api.types.is_string_dtype(column.dtype) and column.dtype != object:
+        return True
+    return column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string'
+
+def optimize_dtypes(frame: pd.DataFrame, category_ratio: float = 0.5, downcast_floats: bool = False,
+                    arrow_strings: bool = False) -> Tuple[pd.DataFrame, Dict]:
+    """
+    Compact dtype layout for a dataset, without changing any value
+    
+    - String columns with at most ``category_ratio`` distinct values per
+      row become categoricals (faster groupby, one copy of each label)
+    - Integer columns are downcast to the smallest integer type holding them
+    - With ``downcast_floats``, float64 columns whose values all round-trip
+      exactly through float32 become float32. Off by default: pandas sums
+      float32 columns in float32, so group totals would change slightly
+    - With ``arrow_strings``, the remaining string columns become
+      Arrow-backed strings (needs pyarrow)
+    
+    Statistics and correlations convert to float64 before computing, so they
+    are unchanged on the optimized frame.
+    
+    Args:
+        frame (pd.DataFrame): Input dataset (not modified)
+        category_ratio (float): Maximum distinct-to-rows ratio for a categorical
+        downcast_floats (bool): Also downcast losslessly representable floats
+        arrow_strings (bool): Store non-categorical strings as ``string[pyarrow]``
+    
+    Returns:
+        Tuple[pd.DataFrame, Dict]: The optimized frame, and a report with
+        ``bytes_before``, ``bytes_after`` and ``columns`` ({column: (old dtype, new dtype)})
+    """
+    optimized = {}
+    changes = {}
+    for col in frame.columns:
+        column = frame[col]
+        dtype = column.dtype
+        if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+            converted = pd.to_numeric(column, downcast='integer')
+        elif dtype == np.float64 and downcast_floats:
+            as_float32 = column.to_numpy().astype(np.float32)
+            lossless = np.array_equal(as_float32.astype(np.float64), column.to_numpy(), equal_nan=True)
+            converted = column.astype(np.float32) if lossless else column
+        elif _is_string_column(column):
+            if column.nunique(dropna=True) <= category_ratio * len(column):
+                converted = column.astype('category')
+            elif arrow_strings:
+                converted = column.astype('string[pyarrow]')
+            else:
+                converted = column
+        else:
+            converted = column
+        optimized[col] = converted
+        if converted.dtype != dtype:
+            changes[col] = (str(dtype), str(converted.dtype))
+    
+    result = pd.DataFrame(optimized, index=frame.index)
+    report = {
+        'bytes_before': int(frame.memory_usage(deep=True).sum()),
+        'bytes_after': int(result.memory_usage(deep=True).sum()),
+        'columns': changes,
+    }
+    return result, report
+
+def _filter_expression(schema, filters: Dict[str, Any]):
+    """
+    Arrow filter expression from ``{column: condition}``
+    
+    A condition is a single value (equality), a list or set of values
+    (membership), or a 2-tuple ``(low, high)`` inclusive range where either
+    end may be None. Values are cast to the column's Arrow type (the value
+    type for dictionary-encoded columns), so dates can be given as strings.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    def value_type(column):
+        # Dictionary-encoded columns (e.g. pandas categoricals) compare by their values
+        arrow_type = schema.field(column).type
+        return arrow_type.value_type if pa.types.is_dictionary(arrow_type) else arrow_type
+    
+    def scalar(column, value):
+        arrow_type = value_type(column)
+        if pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type):
+            return pa.scalar(pd.Timestamp(value).to_pydatetime()).cast(arrow_type, safe=False)
+        return pa.scalar(value).cast(arrow_type)
+    
+    expression = None
+    for column, condition in filters.items():
+        field = pc.field(column)
+        if isinstance(condition, tuple):
+            low, high = condition
+            parts = []
+            if low is not None:
+                parts.append(field >= scalar(column, low))
+            if high is not None:
+                parts.append(field <= scalar(column, high))
+            if not parts:
+                continue
+            term = parts[0] if len(parts) == 1 else parts[0] & parts[1]
+        elif isinstance(condition, (list, set, frozenset)):
+            values = [scalar(column, value) for value in condition]
+            term = field.isin(pa.array([value.as_py() for value in values], type=value_type(column)))
+        else:
+            term = field == scalar(column, condition)
+        expression = term if expression is None else expression & term
+    return expression
+
+def read_table(path: str, file_format: str, columns: Optional[List[str]] = None,
+               filters: Optional[Dict[str, Any]] = None, memory_map: bool = True) -> pd.DataFrame:
+    """
+    Read a Parquet, Feather/Arrow IPC or CSV file (or directory of them)
+    with column projection and row filters applied by the Arrow scanner
+    
+    Only ``columns`` are decoded, plus any filter columns. For Parquet,
+    row groups whose statistics cannot match the filters are skipped
+    without being read. With ``memory_map``, files are memory-mapped rather
+    than read into buffers, so uncompressed Feather input is scanned in
+    place and only the pages actually touched are loaded.
+    
+    Args:
+        path (str): File or directory
+        file_format (str): 'parquet', 'feather' or 'csv'
+        columns (List[str]): Columns to return; all columns if omitted
+        filters (Dict[str, Any]): Row filters, see _filter_expression
+        memory_map (bool): Memory-map the input files
+    
+    Returns:
+        pd.DataFrame: Matching rows of the selected columns
+    """
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+    
+    formats = {'parquet': 'parquet', 'feather': 'ipc', 'csv': 'csv'}
+    if file_format not in formats:
+        raise ValueError(f"Unsupported format: {file_format!r} (expected one of {sorted(formats)})")
+    dataset = ds.dataset(path, format=formats[file_format],
+                         filesystem=fs.LocalFileSystem(use_mmap=memory_map))
+    expression = _filter_expression(dataset.schema, filters) if filters else None
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas(date_as_object=False)
+
+# --- Synthetic sales data ---
+
+SAMPLE_CATEGORIES = ['Electronics', 'Clothing', 'Books', 'Home', 'Sports']
+SAMPLE_REGIONS = ['North', 'South', 'East', 'West']
+SAMPLE_START_DATE = '2023-01-01'
+SAMPLE_MAX_DAYS = 3650            # dates span at most ten years
+SAMPLE_CHUNK_ROWS = 1_000_000     # rows per independently seeded chunk
+
+def _sample_labels(base: List[str], count: int, prefix: str) -> np.ndarray:
+    extra = [f"{prefix} {i}" for i in range(len(base) + 1, count + 1)]
+    return np.array(base[:count] + extra, dtype=object)
+
+def _sample_chunk(seed: np.random.SeedSequence, start: int, rows: int, total_rows: int,
+                  n_categories: int = 5, n_regions: int = 4, extra_numeric: int = 0,
+                  missing_rate: float = 0.0, days: Optional[int] = None) -> pd.DataFrame:
+    """
+    Rows ``start`` .. ``start + rows`` of a synthetic sales dataset, drawn from ``seed``
+    """
+    rng = np.random.default_rng(seed)
+    days = days or min(total_rows, SAMPLE_MAX_DAYS)
+    day = (np.arange(start, start + rows, dtype=np.int64) * days) // total_rows
+    data = {
+        'date': pd.Timestamp(SAMPLE_START_DATE) + pd.to_timedelta(day, unit='D'),
+        'product_category': _sample_labels(SAMPLE_CATEGORIES, n_categories, 'Category')[rng.integers(0, n_categories, rows)],
+        'sales_amount': np.abs(rng.normal(150, 50, rows)),
+        'quantity_sold': rng.poisson(5, rows),
+        'customer_age': np.clip(rng.normal(35, 12, rows), 18, 80),
+        'customer_satisfaction': rng.uniform(1, 5, rows),
+        'region': _sample_labels(SAMPLE_REGIONS, n_regions, 'Region')[rng.integers(0, n_regions, rows)],
+    }
+    for i in range(1, extra_numeric + 1):
+        data[f'metric_{i}'] = rng.normal(0, 1, rows)
+    
+    if missing_rate > 0:
+        for col in ['sales_amount', 'customer_age', 'customer_satisfaction'] + [f'metric_{i}' for i in range(1, extra_numeric + 1)]:
+            data[col][rng.random(rows) < missing_rate] = np.nan
+    return pd.DataFrame(data, index=pd.RangeIndex(start, start + rows))
+
+def _chunk_plan(rows: int, chunk_rows: int, seed: int) -> List[Tuple[int, int, np.random.SeedSequence]]:
+    """
+    (start, rows, seed sequence) per chunk; each chunk has its own child stream,
+    so the data depends only on ``seed`` and ``chunk_rows``, not on worker count
+    """
+    starts = range(0, rows, chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    return [(start, min(chunk_rows, rows - start), child) for start, child in zip(starts, seeds)]
+
+def iter_sales_data(rows: int, seed: int = 42, chunk_rows: int = SAMPLE_CHUNK_ROWS,
+                    **options) -> Iterator[pd.DataFrame]:
+    """
+    Generate a synthetic sales dataset chunk by chunk
+    
+    Args:
+        rows (int): Total number of rows
+        seed (int): Root seed; chunk streams are spawned from it
+        chunk_rows (int): Rows per chunk
+        **options: n_categories, n_regions, extra_numeric (extra ``metric_<i>``
+            columns), missing_rate (share of NaNs in float columns), days
+            (dates spread evenly over this many days; default one row per day
+            up to SAMPLE_MAX_DAYS)
+    
+    Yields:
+        pd.DataFrame: Consecutive chunks, indexed by global row number
+    """
+    for start, count, child in _chunk_plan(rows, chunk_rows, seed):
+        yield _sample_chunk(child, start, count, rows, **options)
+
+def generate_sales_data(rows: int = 1000, seed: int = 42, chunk_rows: int = SAMPLE_CHUNK_ROWS,
+                        **options) -> pd.DataFrame:
+    """
+    Synthetic sales dataset in memory (see iter_sales_data for the options)
+    
+    Returns:
+        pd.DataFrame: The concatenated chunks
+    """
+    return pd.concat(iter_sales_data(rows, seed, chunk_rows, **options))
+
+def _write_shard(job: Tuple) -> str:
+    """
+    Worker task: generate one chunk and write it as a Parquet or CSV shard
+    """
+    (start, count, child), rows, path, file_format, options = job
+    chunk = _sample_chunk(child, start, count, rows, **options)
+    if file_format == 'parquet':
+        chunk.to_parquet(path, index=False)
+    else:
+        chunk.to_csv(path, index=False)
+    return path
+
+def write_sales_data(output_dir: str, rows: int, file_format: str = 'parquet', seed: int = 42,
+                     chunk_rows: int = SAMPLE_CHUNK_ROWS, workers: Optional[int] = None,
+                     **options) -> List[str]:
+    """
+    Generate a synthetic sales dataset straight to shards, in parallel
+    
+    Each shard is one chunk, generated and written by a worker process, so
+    memory use is bounded by ``chunk_rows`` per worker regardless of ``rows``.
+    The shards hold exactly the rows generate_sales_data would return for
+    the same arguments. The directory can be analyzed with
+    ``DataAnalyzer.chunked(output_dir)``.
+    
+    Args:
+        output_dir (str): Directory for ``part-<n>.<format>`` files (created if needed)
+        rows (int): Total number of rows
+        file_format (str): 'parquet' or 'csv'
+        seed (int): Root seed
+        chunk_rows (int): Rows per shard
+        workers (int): Worker processes; defaults to the CPU count
+        **options: Generator options, see iter_sales_data
+    
+    Returns:
+        List[str]: Shard paths, in row order
+    """
+    if file_format not in ('parquet', 'csv'):
+        raise ValueError(f"Unsupported format: {file_format!r} (expected 'parquet' or 'csv')")
+    os.makedirs(output_dir, exist_ok=True)
+    plan = _chunk_plan(rows, chunk_rows, seed)
+    width = max(5, len(str(len(plan) - 1)))
+    jobs = [(chunk, rows, os.path.join(output_dir, f"part-{i:0{width}d}.{file_format}"), file_format, options)
+            for i, chunk in enumerate(plan)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write_shard, jobs))
+
+# Upper bound on the float64 working block used by describe_numeric
+STATS_BLOCK_BYTES = 256 * 1024 * 1024
+
+def _describe_block(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    All basic statistics for every column of a 2-D float block at once
+    
+    NaNs are treated as missing. Columns without NaNs take the plain NumPy
+    reductions; only columns that contain NaNs go through the masked path.
+    Columns with no values get NaN statistics.
+    """
+    rows, width = values.shape
+    missing = np.isnan(values).sum(axis=0)
+    count = rows - missing
+    stats = {name: np.full(width, np.nan) for name in ('mean', 'median', 'std', 'min', 'max')}
+    stats['count'] = count
+    stats['missing'] = missing
+    if rows == 0:
+        return stats
+    
+    dense = np.flatnonzero(missing == 0)
+    if len(dense):
+        block = values[:, dense]
+        stats['mean'][dense] = block.mean(axis=0)
+        stats['median'][dense] = np.median(block, axis=0)
+        if rows > 1:
+            stats['std'][dense] = block.std(axis=0, ddof=1)
+        stats['min'][dense] = block.min(axis=0)
+        stats['max'][dense] = block.max(axis=0)
+    
+    for i in np.flatnonzero((missing > 0) & (count > 0)):
+        column = values[:, i]
+        column = column[~np.isnan(column)]
+        stats['mean'][i] = column.mean()
+        stats['median'][i] = np.median(column)
+        if len(column) > 1:
+            stats['std'][i] = column.std(ddof=1)
+        stats['min'][i] = column.min()
+        stats['max'][i] = column.max()
+    return stats
+
+def describe_numeric(frame: pd.DataFrame) -> Dict:
+    """
+    Basic statistics for all numeric columns in one vectorized pass
+    
+    Numeric columns are converted to float64 blocks of at most
+    STATS_BLOCK_BYTES, and every metric for a block is computed from that
+    single array with whole-block NumPy reductions, rather than by seven
+    separate pandas reductions per column. Integer columns take min/max
+    from their own values so they stay exact.
+    
+    Args:
+        frame (pd.DataFrame): Input dataset
+    
+    Returns:
+        Dict: {column: {'mean', 'median', 'std', 'min', 'max', 'count', 'missing'}}
+    """
+    numerical_cols = frame.select_dtypes(include=[np.number]).columns
+    # Integer columns take min/max from their native values, as the per-column
+    # reductions do: float64 would round anything beyond 2**53
+    integer_cols = {col for col in numerical_cols if pd.api.types.is_integer_dtype(frame.dtypes[col])}
+    block_width = max(1, STATS_BLOCK_BYTES // max(1, 8 * len(frame)))
+    stats = {}
+    
+    for start in range(0, len(numerical_cols), block_width):
+        columns = numerical_cols[start:start + block_width]
+        values = frame[columns].to_numpy(dtype=float, na_value=np.nan)
+        block = _describe_block(values)
+        for i, col in enumerate(columns):
+            if col in integer_cols and block['count'][i]:
+                minimum, maximum = int(frame[col].min()), int(frame[col].max())
+            else:
+                minimum, maximum = float(block['min'][i]), float(block['max'][i])
+            stats[col] = {
+                'mean': float(block['mean'][i]),
+                'median': float(block['median'][i]),
+                'std': float(block['std'][i]),
+                'min': minimum,
+                'max': maximum,
+                'count': int(block['count'][i]),
+                'missing': int(block['missing'][i])
+            }
+    return stats
+
+class QuantileSketch:
+    """
+    Mergeable relative-error quantile sketch (DDSketch-style log buckets)
+    
+    Values are counted in logarithmic buckets, so memory grows with the
+    logarithm of the value range rather than with the number of values, and
+    two sketches merge by adding bucket counts. For a sketch holding n
+    finite values, ``quantile(q)`` is within ``relative_accuracy`` (1% by
+    default) of the true value at rank floor(q * (n - 1)):
+    |estimate - x| <= relative_accuracy * |x|. For an even n the exact median
+    averages the two middle values, so the estimate is bounded relative to
+    the lower one. Non-finite values are ignored.
+    """
+    
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = {}  # bucket index -> count
+        self.negative = {}  # bucket index of |value| -> count
+        self.zeros = 0
+        self.count = 0
+    
+    def _add_buckets(self, store: Dict[int, int], magnitudes: np.ndarray) -> None:
+        if not len(magnitudes):
+            return
+        keys, counts = np.unique(np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                                 return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+    
+    def update(self, values: np.ndarray) -> 'QuantileSketch':
+        """
+        Add a batch of values (NaN and infinities are skipped)
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+        self.zeros += int((values == 0).sum())
+        self.count += len(values)
+        return self
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Fold another sketch with the same accuracy into this one
+        """
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for store, other_store in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimated value at quantile ``q`` (0 <= q <= 1), NaN if the sketch is empty
+        """
+        if self.count == 0:
+            return np.nan
+        rank = math.floor(q * (self.count - 1))
+        midpoint = 2 / (self.gamma + 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -midpoint * self.gamma ** key
+        seen += self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return midpoint * self.gamma ** key
+        return midpoint * self.gamma ** max(self.positive)
+
+# Running group totals kept by DataAnalyzer.append: group column -> summed column
+SALES_GROUP_TOTALS = {
+    'product_category': 'sales_amount',
+    'region': 'sales_amount',
+    'date': 'sales_amount',
+}
+
+class StatsAccumulator:
+    """
+    Mergeable one-pass accumulators for basic statistics and correlations
+    
+    Per-column count, mean and sum of squared deviations are combined with
+    the Welford/Chan update, so chunks can be added in any order or
+    accumulated separately and merged. Correlations are built from pairwise
+    co-moment sums over rows where both columns are present, matching the
+    pairwise deletion of ``DataFrame.corr()``. Values are shifted by the
+    first non-empty chunk's column means to keep those sums well conditioned.
+    Chunks without rows only add to the missing-value counts.
+    
+    Medians need the full data, so they are estimated from a QuantileSketch
+    per column (see its error bound). Optional group totals keep
+    ``group -> sum`` per configured group column; updating them touches
+    only the groups present in the chunk.
+    
+    The numeric columns are fixed by the first chunk; numeric columns that
+    first appear later are ignored.
+    """
+    
+    def __init__(self, group_totals: Optional[Dict[str, str]] = None,
+                 sketch_accuracy: float = 0.01):
+        """
+        Args:
+            group_totals (Dict[str, str]): Group column -> column to sum per group
+            sketch_accuracy (float): Relative accuracy of the median sketches
+        """
+        self.group_totals_spec = dict(group_totals or {})
+        self.sketch_accuracy = sketch_accuracy
+        self.group_totals = {}   # group column -> {group value: sum}
+        self.sketches = []
+        self.rows = 0
+        self.columns = None      # numeric columns, fixed by the first chunk
+        self.dtypes = None       # dtypes of all columns in the first chunk
+        self.missing = None      # missing values per column (all columns)
+        self.count = self.mean = self.m2 = self.min = self.max = None
+        self.shift = None
+        self.pair_n = self.pair_sum = self.pair_sumsq = self.pair_cross = None
+    
+    def _initialize(self, frame: pd.DataFrame) -> None:
+        self.columns = frame.select_dtypes(include=[np.number]).columns
+        self.dtypes = frame.dtypes
+        self.missing = pd.Series(0, index=frame.columns, dtype=np.int64)
+        p = len(self.columns)
+        self.count = np.zeros(p, dtype=np.int64)
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros(p)
+        self.min = np.full(p, np.inf)
+        self.max = np.full(p, -np.inf)
+        self.shift = np.zeros(p)
+        self.pair_n = np.zeros((p, p))
+        self.pair_sum = np.zeros((p, p))
+        self.pair_sumsq = np.zeros((p, p))
+        self.pair_cross = np.zeros((p, p))
+        self.sketches = [QuantileSketch(self.sketch_accuracy) for _ in range(p)]
+        self.group_totals = {group: {} for group, value in self.group_totals_spec.items()
+                             if group in frame.columns and value in frame.columns}
+    
+    def update(self, frame: pd.DataFrame) -> 'StatsAccumulator':
+        """
+        Fold one chunk of rows into the accumulators
+        """
+        if self.columns is None:
+            self._initialize(frame)
+        self.missing = self.missing.add(frame.isnull().sum(), fill_value=0).astype(np.int64)
+        if len(frame) == 0:
+            return self
+        
+        values = frame[self.columns].to_numpy(dtype=float, na_value=np.nan)
+        if self.rows == 0:
+            # No co-moment sums yet, so the shift can still be chosen freely
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                self.shift = np.nan_to_num(np.nanmean(values, axis=0))
+        self.rows += len(frame)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0)
+        filled = np.where(present, values, 0.0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = filled.sum(axis=0) / count
+        m2 = np.where(present, values - mean, 0.0)
+        m2 = (m2 * m2).sum(axis=0)
+        self._merge_moments(count, np.nan_to_num(mean), m2,
+                            np.where(present, values, np.inf).min(axis=0),
+                            np.where(present, values, -np.inf).max(axis=0))
+        
+        shifted = np.where(present, values - self.shift, 0.0)
+        weights = present.astype(float)
+        self.pair_n += weights.T @ weights
+        self.pair_sum += shifted.T @ weights
+        self.pair_sumsq += (shifted * shifted).T @ weights
+        self.pair_cross += shifted.T @ shifted
+        
+        for i, sketch in enumerate(self.sketches):
+            sketch.update(values[:, i])
+        for group, totals in self.group_totals.items():
+            sums = frame.groupby(group, observed=True)[self.group_totals_spec[group]].sum()
+            for key, value in sums.items():
+                totals[key] = totals.get(key, 0) + value
+        return self
+    
+    def _merge_moments(self, count, mean, m2, minimum, maximum) -> None:
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, count / total, 0.0)
+            self.m2 = self.m2 + m2 + np.where(total > 0, delta * delta * self.count * weight, 0.0)
+        self.mean = self.mean + delta * weight
+        self.count = total
+        self.min = np.minimum(self.min, minimum)
+        self.max = np.maximum(self.max, maximum)
+    
+    def merge(self, other: 'StatsAccumulator') -> 'StatsAccumulator':
+        """
+        Combine another accumulator over the same columns into this one
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            return self
+        if not self.columns.equals(other.columns):
+            raise ValueError("Cannot merge accumulators over different columns")
+        
+        # Re-express the other side's shifted sums relative to this shift
+        offset = other.shift - self.shift
+        pair_sum = other.pair_sum + offset[:, None] * other.pair_n
+        self.pair_sumsq += (other.pair_sumsq + 2 * offset[:, None] * other.pair_sum
+                            + (offset ** 2)[:, None] * other.pair_n)
+        self.pair_cross += (other.pair_cross + offset[:, None] * other.pair_sum.T
+                            + other.pair_sum * offset[None, :]
+                            + np.outer(offset, offset) * other.pair_n)
+        self.pair_sum += pair_sum
+        self.pair_n += other.pair_n
+        
+        self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+        self.rows += other.rows
+        self.missing = self.missing.add(other.missing, fill_value=0).astype(np.int64)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+        for group, totals in self.group_totals.items():
+            for key, value in other.group_totals.get(group, {}).items():
+                totals[key] = totals.get(key, 0) + value
+        return self
+    
+    def statistics(self) -> Dict:
+        """
+        Statistics in the same layout as DataAnalyzer.basic_statistics
+        """
+        stats = {}
+        for i, col in enumerate(self.columns if self.columns is not None else []):
+            count = int(self.count[i])
+            stats[col] = {
+                'mean': float(self.mean[i]) if count else np.nan,
+                'median': self.sketches[i].quantile(0.5),
+                'std': float(np.sqrt(self.m2[i] / (count - 1))) if count > 1 else np.nan,
+                'min': float(self.min[i]) if count else np.nan,
+                'max': float(self.max[i]) if count else np.nan,
+                'count': count,
+                'missing': int(self.missing[col])
+            }
+        return stats
+    
+    def correlation(self) -> pd.DataFrame:
+        """
+        Pairwise-complete Pearson correlation matrix, like ``DataFrame.corr()``
+        """
+        n = self.pair_n
+        sum_x = self.pair_sum
+        sum_y = self.pair_sum.T
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = n * self.pair_cross - sum_x * sum_y
+            variance_x = n * self.pair_sumsq - sum_x * sum_x
+            variance_y = n * self.pair_sumsq.T - sum_y * sum_y
+            denominator = np.sqrt(variance_x * variance_y)
+            corr = np.where((n > 1) & (denominator > 0), covariance / denominator, np.nan)
+        corr = np.clip(corr, -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+    
+    def group_total(self, group: str) -> pd.Series:
+        """
+        Running per-group sums for ``group``, sorted by group value
+        """
+        totals = self.group_totals[group]
+        series = pd.Series(totals, name=self.group_totals_spec[group], dtype=float)
+        return series.rename_axis(group).sort_index()
+
+# Numeric column count from which correlation_analysis switches to blocked_correlation
+BLOCKED_CORRELATION_MIN_COLUMNS = 256
+
+def _correlation_tile(values: np.ndarray, standardized: np.ndarray, has_missing: np.ndarray,
+                      rows: slice, cols: slice) -> np.ndarray:
+    """
+    One tile of the correlation matrix
+    
+    Tiles whose columns have no missing values are a single product of the
+    standardized columns. Tiles touching missing values use pairwise
+    complete sums over rows where both columns are present, like
+    ``DataFrame.corr()``.
+    """
+    if not has_missing[rows].any() and not has_missing[cols].any():
+        return standardized[:, rows].T @ standardized[:, cols]
+    
+    x, y = values[:, rows], values[:, cols]
+    x_present, y_present = ~np.isnan(x), ~np.isnan(y)
+    x, y = np.where(x_present, x, 0.0), np.where(y_present, y, 0.0)
+    x_weights, y_weights = x_present.astype(float), y_present.astype(float)
+    n = x_weights.T @ y_weights
+    sum_x = x.T @ y_weights
+    sum_y = x_weights.T @ y
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = n * (x.T @ y) - sum_x * sum_y
+        variance_x = n * ((x * x).T @ y_weights) - sum_x * sum_x
+        variance_y = n * (x_weights.T @ (y * y)) - sum_y * sum_y
+        denominator = np.sqrt(variance_x * variance_y)
+        return np.where((n > 1) & (denominator > 0), covariance / denominator, np.nan)
+
+def blocked_correlation(frame: pd.DataFrame, block_size: int = 512, workers: Optional[int] = None,
+                        out: Optional[str] = None) -> Union[pd.DataFrame, np.ndarray]:
+    """
+    Pearson correlation of the numeric columns, computed tile by tile in parallel
+    
+    Columns are centered (and, where complete, scaled to unit norm) once.
+    The upper-triangle tiles of the matrix are then computed as BLAS matrix
+    products on a thread pool and mirrored into the lower triangle. Missing
+    values are handled by pairwise deletion, as in ``DataFrame.corr()``,
+    and results agree with it to floating-point tolerance.
+    
+    Args:
+        frame (pd.DataFrame): Input dataset (non-numeric columns are ignored)
+        block_size (int): Columns per tile side
+        workers (int): Threads computing tiles; defaults to the CPU count
+        out (str): Optional ``.npy`` path; the matrix is then written to a
+            memory-mapped file instead of being held in memory
+    
+    Returns:
+        Union[pd.DataFrame, np.ndarray]: Correlation matrix, or the
+        ``np.memmap`` backed by ``out`` when a path is given
+    """
+    numerical_data = frame.select_dtypes(include=[np.number])
+    columns = numerical_data.columns
+    values = numerical_data.to_numpy(dtype=float, na_value=np.nan)
+    has_missing = np.isnan(values).any(axis=0)
+    
+    # Center every column; scale complete columns to unit norm for the fast path
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        values = values - np.nanmean(values, axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        standardized = values / np.sqrt((values * values).sum(axis=0))
+    
+    width = len(columns)
+    if out is not None:
+        result = np.lib.format.open_memmap(out, mode='w+', dtype=np.float64, shape=(width, width))
+    else:
+        result = np.empty((width, width))
+    
+    bounds = [slice(start, min(start + block_size, width)) for start in range(0, width, block_size)]
+    tiles = [(rows, cols) for i, rows in enumerate(bounds) for cols in bounds[i:]]
+    
+    def compute(tile):
+        rows, cols = tile
+        block = np.clip(_correlation_tile(values, standardized, has_missing, rows, cols), -1.0, 1.0)
+        result[rows, cols] = block
+        result[cols, rows] = block.T
+    
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        list(pool.map(compute, tiles))
+    
+    if out is not None:
+        result.flush()
+        return result
+    return pd.DataFrame(result, index=columns, columns=columns)
+
+def top_correlations(correlation_matrix: pd.DataFrame, k: Optional[int] = 5,
+                     threshold: Optional[float] = None, block_rows: int = 1024) -> pd.DataFrame:
+    """
+    Strongest pairwise correlations from the upper triangle of a correlation matrix
+    
+    The matrix is scanned in row blocks, so memory stays proportional to
+    ``block_rows`` times the number of columns. Each block keeps only its
+    own top ``k`` candidates (a partial selection with ``np.partition``),
+    so no list of all pairs is built and only the survivors are sorted. NaN correlations are
+    skipped. Ties keep matrix order, as a stable sort would.
+    
+    Args:
+        correlation_matrix (pd.DataFrame): Square correlation matrix
+        k (int): Number of pairs to return; None returns every qualifying pair
+        threshold (float): Only keep pairs with ``|r| >= threshold`` (sparse output)
+        block_rows (int): Matrix rows processed per block
+    
+    Returns:
+        pd.DataFrame: Columns ``var1``, ``var2``, ``correlation``, strongest first
+    """
+    if k is not None and k < 1:
+        return pd.DataFrame({'var1': [], 'var2': [], 'correlation': []})
+    values = correlation_matrix.to_numpy(dtype=float)
+    names = np.asarray(correlation_matrix.columns, dtype=object)
+    width = values.shape[1]
+    all_columns = np.arange(width)
+    found_rows, found_cols, found_strength = [], [], []
+    
+    for start in range(0, len(values), block_rows):
+        block = values[start:start + block_rows]
+        strength = np.abs(block)
+        keep = (all_columns[None, :] > np.arange(start, start + len(block))[:, None]) & ~np.isnan(strength)
+        if threshold is not None:
+            keep &= strength >= threshold
+        rows, cols = np.nonzero(keep)
+        strength = strength[rows, cols]
+        if k is not None and len(strength) > k:
+            # Keep everything tied with the k-th strongest so ties resolve in matrix order
+            cutoff = np.partition(strength, len(strength) - k)[len(strength) - k]
+            selected = strength >= cutoff
+            rows, cols, strength = rows[selected], cols[selected], strength[selected]
+        found_rows.append(rows + start)
+        found_cols.append(cols)
+        found_strength.append(strength)
+    
+    rows = np.concatenate(found_rows) if found_rows else np.empty(0, dtype=np.int64)
+    cols = np.concatenate(found_cols) if found_cols else np.empty(0, dtype=np.int64)
+    strength = np.concatenate(found_strength) if found_strength else np.empty(0)
+    order = np.lexsort((cols, rows, -strength))
+    if k is not None:
+        order = order[:k]
+    rows, cols = rows[order], cols[order]
+    return pd.DataFrame({
+        'var1': names[rows],
+        'var2': names[cols],
+        'correlation': values[rows, cols]
+    })
+
+# --- Plot summaries ---
+# Panels are drawn from fixed-size summaries computed with NumPy, so rendering
+# cost does not grow with the row count.
+
+PLOT_MAX_POINTS = 5000      # scatter points drawn per panel
+PLOT_MAX_FLIERS = 500       # outliers drawn per box
+PLOT_SAMPLE_SEED = 0
+
+def histogram_summary(values, bins: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bin counts and edges of the non-missing values
+    
+    Args:
+        values: 1-D array-like
+        bins (int): Number of equal-width bins
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (counts, edges)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    return np.histogram(values[~np.isnan(values)], bins=bins)
+
+def sample_points(x, y, max_points: int = PLOT_MAX_POINTS,
+                  seed: int = PLOT_SAMPLE_SEED) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Uniform sample of at most ``max_points`` (x, y) pairs, without replacement
+    
+    Args:
+        x, y: 1-D array-likes of equal length
+        max_points (int): Sample size cap
+        seed (int): Seed for numpy.random.Generator, so repeated renders match
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The sampled (x, y), in original row order
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    if len(x) <= max_points:
+        return x, y
+    rows = np.sort(np.random.default_rng(seed).choice(len(x), max_points, replace=False))
+    return x[rows], y[rows]
+
+def box_summary(data: pd.DataFrame, value: str, group: str, whis: float = 1.5,
+                max_fliers: int = PLOT_MAX_FLIERS) -> List[Dict[str, Any]]:
+    """
+    Per-group box-plot statistics in the form ``Axes.bxp`` expects
+    
+    Quartiles and whiskers follow matplotlib's ``boxplot`` rules (whiskers
+    at the furthest values within ``whis`` IQRs); fliers are sampled down to
+    ``max_fliers`` per group.
+    
+    Args:
+        data (pd.DataFrame): Source rows
+        value (str): Numeric column
+        group (str): Grouping column
+        whis (float): Whisker reach in IQRs
+        max_fliers (int): Outliers kept per group
+        
+    Returns:
+        List[Dict[str, Any]]: One stats dict per group, in sorted group order
+    """
+    frame = data[[group, value]].dropna()
+    grouped = frame.groupby(group, sort=True, observed=True)[value]
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    iqr = quartiles[0.75] - quartiles[0.25]
+    low = frame[group].map(quartiles[0.25] - whis * iqr).to_numpy(dtype=float)
+    high = frame[group].map(quartiles[0.75] + whis * iqr).to_numpy(dtype=float)
+    values = frame[value].to_numpy(dtype=float)
+    inside = (values >= low) & (values <= high)
+    whiskers = frame[inside].groupby(group, sort=True, observed=True)[value].agg(['min', 'max'])
+    outliers = frame.loc[~inside, [group, value]]
+    
+    stats = []
+    for label, row in quartiles.iterrows():
+        fliers = outliers.loc[outliers[group] == label, value].to_numpy()
+        if len(fliers) > max_fliers:
+            fliers, _ = sample_points(fliers, fliers, max_fliers)
+        q1, q3 = row[0.25], row[0.75]
+        # As in matplotlib, whiskers never fall inside the box, and a group
+        # with no points inside the fences gets whiskers at the quartiles.
+        if label in whiskers.index:
+            whislo = min(whiskers.loc[label, 'min'], q1)
+            whishi = max(whiskers.loc[label, 'max'], q3)
+        else:
+            whislo, whishi = q1, q3
+        stats.append({
+            'label': label,
+            'q1': q1,
+            'med': row[0.5],
+            'q3': q3,
+            'whislo': whislo,
+            'whishi': whishi,
+            'fliers': fliers,
+        })
+    return stats
+
+# --- Plot panels ---
+# Each panel draws onto a given Axes from the inputs DataAnalyzer._panel_inputs
+# prepares, so it can render into the combined sheet or on its own in a worker.
+
+def _plot_histogram(ax, histogram: Tuple[np.ndarray, np.ndarray], **style) -> None:
+    counts, edges = histogram
+    ax.hist(edges[:-1], bins=edges, weights=counts, **style)
+
+def _plot_sales_distribution(ax, histogram: Tuple[np.ndarray, np.ndarray]) -> None:
+    _plot_histogram(ax, histogram, alpha=0.7, color='skyblue', edgecolor='black')
+    ax.set_title('Sales Amount Distribution')
+    ax.set_xlabel('Sales Amount ($)')
+    ax.set_ylabel('Frequency')
+
+def _plot_category_sales(ax, category_sales: pd.Series) -> None:
+    ax.pie(category_sales.values, labels=category_sales.index, autopct='%1.1f%%')
+    ax.set_title('Total Sales by Product Category')
+
+def _plot_daily_trend(ax, daily_sales: pd.Series) -> None:
+    ax.plot(daily_sales.index, daily_sales.values, linewidth=2)
+    ax.set_title('Daily Sales Trend')
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Total Sales ($)')
+    ax.tick_params(axis='x', labelrotation=45)
+
+def _plot_correlation_heatmap(ax, correlation_matrix: pd.DataFrame) -> None:
+    _, sns = _plotting()
+    sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0, ax=ax)
+    ax.set_title('Correlation Heatmap')
+
+def _plot_sales_by_category(ax, boxes: List[Dict[str, Any]]) -> None:
+    ax.bxp(boxes)
+    ax.grid(True)
+    ax.set_title('Sales Amount by Category')
+    ax.set_xlabel('product_category')
+
+def _plot_age_distribution(ax, histogram: Tuple[np.ndarray, np.ndarray]) -> None:
+    _plot_histogram(ax, histogram, alpha=0.7, color='lightgreen', edgecolor='black')
+    ax.set_title('Customer Age Distribution')
+    ax.set_xlabel('Age')
+    ax.set_ylabel('Frequency')
+
+def _plot_satisfaction_vs_sales(ax, points: Tuple[np.ndarray, np.ndarray]) -> None:
+    ax.scatter(*points, alpha=0.6)
+    ax.set_title('Customer Satisfaction vs Sales Amount')
+    ax.set_xlabel('Satisfaction Rating')
+    ax.set_ylabel('Sales Amount ($)')
+
+def _plot_regional_sales(ax, regional_sales: pd.Series) -> None:
+    ax.bar(regional_sales.index, regional_sales.values, color=['red', 'blue', 'green', 'orange'])
+    ax.set_title('Total Sales by Region')
+    ax.set_ylabel('Total Sales ($)')
+
+def _plot_quantity_vs_sales(ax, points: Tuple[np.ndarray, np.ndarray]) -> None:
+    ax.scatter(*points, alpha=0.6, color='purple')
+    ax.set_title('Quantity Sold vs Sales Amount')
+    ax.set_xlabel('Quantity Sold')
+    ax.set_ylabel('Sales Amount ($)')
+
+# Panel name -> drawing function, in sheet order (3 x 3 grid)
+PANELS = {
+    'sales_distribution': _plot_sales_distribution,
+    'category_sales': _plot_category_sales,
+    'daily_trend': _plot_daily_trend,
+    'correlation_heatmap': _plot_correlation_heatmap,
+    'sales_by_category': _plot_sales_by_category,
+    'age_distribution': _plot_age_distribution,
+    'satisfaction_vs_sales': _plot_satisfaction_vs_sales,
+    'regional_sales': _plot_regional_sales,
+    'quantity_vs_sales': _plot_quantity_vs_sales,
+}
+
+SHEET_FIGSIZE = (20, 16)
+PANEL_FIGSIZE = (7, 5.5)
+SHEET_NAME = 'sheet'
+
+def _draw_sheet(inputs: Dict[str, Any]):
+    """
+    Draw every panel into the combined 3 x 3 figure
+    """
+    plt, _ = _plotting()
+    fig = plt.figure(figsize=SHEET_FIGSIZE)
+    for position, (name, draw) in enumerate(PANELS.items(), start=1):
+        draw(fig.add_subplot(3, 3, position), inputs[name])
+    fig.tight_layout()
+    return fig
+
+def _render_job(job: Tuple[str, Any, str, int]) -> str:
+    """
+    Worker task: render one panel, or the combined sheet, to a file with Agg
+    
+    Args:
+        job: (panel name or SHEET_NAME, panel inputs, output path, dpi)
+    
+    Returns:
+        str: The written path
+    """
+    name, inputs, path, dpi = job
+    plt, _ = _plotting('Agg')
+    if name == SHEET_NAME:
+        fig = _draw_sheet(inputs)
+    else:
+        fig, ax = plt.subplots(figsize=PANEL_FIGSIZE)
+        PANELS[name](ax, inputs)
+        fig.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return path
+
+def run_render_jobs(jobs: List[Tuple[str, Any, str, int]], workers: Optional[int] = None) -> List[str]:
+    """
+    Render jobs from DataAnalyzer.panel_jobs in a process pool
+    
+    Jobs from several analyzers (e.g. one per segment) can be pooled into
+    one call so every core stays busy.
+    
+    Args:
+        jobs: Render jobs
+        workers (int): Worker processes; defaults to the CPU count
+    
+    Returns:
+        List[str]: Written paths, in job order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_job, jobs))
+
+def render_segments(segments: Dict[str, pd.DataFrame], output_dir: str,
+                    workers: Optional[int] = None, **options) -> Dict[str, Dict[str, str]]:
+    """
+    Render the panels for many datasets with one shared process pool
+    
+    Args:
+        segments (Dict[str, pd.DataFrame]): Segment name -> dataset
+        output_dir (str): Each segment is written to ``output_dir/<segment>/``
+        workers (int): Worker processes; defaults to the CPU count
+        **options: Passed to DataAnalyzer.panel_jobs (formats, dpi, composite)
+    
+    Returns:
+        Dict[str, Dict[str, str]]: Segment -> panel name -> written path
+    """
+    jobs, owners = [], []
+    for segment, frame in segments.items():
+        segment_jobs = DataAnalyzer(frame).panel_jobs(os.path.join(output_dir, str(segment)), **options)
+        jobs.extend(segment_jobs)
+        owners.extend((segment, job[0]) for job in segment_jobs)
+    
+    results = {segment: {} for segment in segments}
+    for (segment, name), path in zip(owners, run_render_jobs(jobs, workers)):
+        results[segment][name] = path
+    return results
+
+def _result_nbytes(value: Any) -> int:
+    """
+    Approximate memory held by an analysis result
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_result_nbytes(k) + _result_nbytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_result_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+def _copy_result(value: Any) -> Any:
+    """
+    Copy a cached result so callers cannot modify the cached object
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return value.copy()
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    return value
+
+class AnalysisCache:
+    """
+    Process-wide LRU cache of analysis results, bounded by approximate memory
+    
+    Entries are keyed by (data fingerprint, analysis name); when the total
+    size exceeds ``max_bytes`` the least recently used results are evicted.
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Cached result for ``key``, computing and storing it on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return _copy_result(entry[0])
+        
+        self.misses += 1
+        value = compute()
+        size = _result_nbytes(value)
+        if size <= self.max_bytes:
+            self._entries[key] = (_copy_result(value), size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+        return value
+    
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Drop every entry whose key matches ``predicate``
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            _, size = self._entries.pop(key)
+            self.current_bytes -= size
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Shared by every DataAnalyzer in the process
+analysis_cache = AnalysisCache()
 
 class DataAnalyzer:
     """
     A comprehensive data analysis and visualization class
     """
     
-    def __init__(self, data: pd.DataFrame = None):
+    def __init__(self, data: pd.DataFrame = None, optimize: bool = False,
+                 verify_content: bool = False):
         """
         Initialize the DataAnalyzer with optional data
         
         Args:
             data (pd.DataFrame): Input dataset
+            optimize (bool): Apply optimize_memory() to ``data`` on load
+            verify_content (bool): Hash the columns an analysis reads on every
+                call, so in-place edits to ``data`` are noticed without
+                invalidate_cache()
         """
+        self._token = next(DataAnalyzer._tokens)
+        self._version = 0
+        self.verify_content = verify_content
+        self.source = None
+        self.chunksize = None
+        self.analysis_results = {}
+        self._accumulator = None
+        self._running = None   # StatsAccumulator maintained by append()
+        self._batches = []     # appended rows not yet concatenated into data
+        self.memory_report = None
         self.data = data
+        if optimize and data is not None:
+            self.optimize_memory()
+    
+    _tokens = itertools.count()
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        if self._batches:
+            frames = ([self._data] if self._data is not None else []) + self._batches
+            self._data = pd.concat(frames, ignore_index=True)
+            self._batches = []
+        return self._data
+    
+    @data.setter
+    def data(self, value: pd.DataFrame) -> None:
+        self._data = value
+        self._batches = []
+        self.invalidate_cache()
+    
+    def _has_frame(self) -> bool:
+        return self._data is not None or bool(self._batches)
+    
+    def _bump_version(self) -> None:
+        token = self._token
+        analysis_cache.discard(lambda key: key[0][0] == token)
+        self._version += 1
         self.analysis_results = {}
+    
+    def invalidate_cache(self) -> None:
+        """
+        Forget cached results for this analyzer
+        
+        Called automatically whenever ``data`` is replaced or rows are
+        appended. Cached results are keyed on that data version, so call this
+        after editing ``data`` in place (or set ``verify_content``). It also
+        drops the running statistics kept by append().
+        """
+        self._bump_version()
+        self._accumulator = None
+        self._running = None
+    
+    def append(self, batch: pd.DataFrame) -> None:
+        """
+        Add a batch of rows, updating statistics incrementally
+        
+        The first call seeds running accumulators from the current data.
+        After that each call costs time proportional to the batch only:
+        basic statistics, missing counts, the correlation matrix and the
+        group totals in SALES_GROUP_TOTALS are updated from the new rows.
+        Medians become QuantileSketch estimates (within 1% relative error).
+        Rows are kept and only concatenated when ``data`` is accessed.
+        
+        Args:
+            batch (pd.DataFrame): New rows with the same columns as the existing data
+        """
+        if not self._has_frame() and self.source is not None:
+            raise ValueError("append() is not supported for chunked analyzers.")
+        running = self._running
+        if running is None:
+            running = StatsAccumulator(group_totals=SALES_GROUP_TOTALS)
+            if self._has_frame():
+                running.update(self.data)
+        running.update(batch)
+        self._running = running
+        self._batches.append(batch)
+        self._bump_version()
+    
+    def _stats_accumulator(self) -> Optional[StatsAccumulator]:
+        """
+        Accumulator backing the statistics, or None when they come from the in-memory frame
+        """
+        if self._running is not None:
+            return self._running
+        if not self._has_frame():
+            return self._accumulate_source()
+        return None
+    
+    def _fingerprint(self, columns: Optional[List[str]] = None, missing: bool = False) -> Optional[Tuple]:
+        """
+        Identity of the data an analysis reads: analyzer, data version, shape
+        and dtypes (or file stats in chunked mode). With ``verify_content`` it
+        also holds a full hash of ``columns``.
+        
+        Args:
+            columns (List[str]): Columns the analysis reads; the numeric columns if omitted
+            missing (bool): With ``verify_content``, also include per-column
+                missing counts of the whole frame
+        
+        Returns:
+            Optional[Tuple]: The fingerprint, or None when the columns cannot be
+            hashed (e.g. lists in an object column), in which case nothing is cached
+        """
+        if self._running is not None:
+            return (self._token, self._version, 'incremental', self._running.rows)
+        if not self._has_frame():
+            stat = os.stat(self.source)
+            return (self._token, self._version, os.path.abspath(self.source),
+                    stat.st_size, stat.st_mtime_ns, self.chunksize)
+        
+        data = self._data
+        fingerprint = (self._token, self._version, data.shape, tuple(data.columns),
+                       tuple(str(dtype) for dtype in data.dtypes))
+        if not self.verify_content:
+            return fingerprint
+        if columns is None:
+            columns = list(data.select_dtypes(include=[np.number]).columns)
+        try:
+            content_hash = int(pd.util.hash_pandas_object(data[columns], index=True).sum())
+        except TypeError:
+            return None
+        fingerprint += (tuple(columns), content_hash)
+        if missing:
+            fingerprint += (tuple(int(count) for count in data.isnull().sum()),)
+        return fingerprint
+    
+    def _cached(self, name: str, compute: Callable[[], Any], columns: Optional[List[str]] = None,
+                missing: bool = False) -> Any:
+        """
+        Memoize one analysis on the data fingerprint
+        """
+        fingerprint = self._fingerprint(columns, missing)
+        if fingerprint is None:
+            result = compute()
+        else:
+            result = analysis_cache.get_or_compute((fingerprint, name), compute)
+        self.analysis_results[name] = result
+        return result
+    
+    @classmethod
+    def _from_file(cls, path: str, file_format: str, columns: Optional[List[str]],
+                   filters: Optional[Dict[str, Any]], memory_map: bool, optimize: bool) -> 'DataAnalyzer':
+        return cls(read_table(path, file_format, columns, filters, memory_map), optimize=optimize)
+    
+    @classmethod
+    def from_parquet(cls, path: str, columns: Optional[List[str]] = None,
+                     filters: Optional[Dict[str, Any]] = None, memory_map: bool = True,
+                     optimize: bool = False) -> 'DataAnalyzer':
+        """
+        Load a Parquet file (or directory of shards), reading only what is needed
+        
+        Args:
+            path (str): Parquet file or directory
+            columns (List[str]): Columns to load; all columns if omitted
+            filters (Dict[str, Any]): Row filters pushed down to the reader, e.g.
+                ``{'region': 'East', 'product_category': ['Books', 'Home'],
+                'date': ('2023-01-01', '2023-06-30')}``
+            memory_map (bool): Memory-map the input files
+            optimize (bool): Apply optimize_memory() after loading
+        
+        Returns:
+            DataAnalyzer: Analyzer holding the selected rows and columns
+        """
+        return cls._from_file(path, 'parquet', columns, filters, memory_map, optimize)
+    
+    @classmethod
+    def from_feather(cls, path: str, columns: Optional[List[str]] = None,
+                     filters: Optional[Dict[str, Any]] = None, memory_map: bool = True,
+                     optimize: bool = False) -> 'DataAnalyzer':
+        """
+        Load a Feather / Arrow IPC file, memory-mapped by default (see from_parquet)
+        """
+        return cls._from_file(path, 'feather', columns, filters, memory_map, optimize)
+    
+    @classmethod
+    def from_csv(cls, path: str, columns: Optional[List[str]] = None,
+                 filters: Optional[Dict[str, Any]] = None, memory_map: bool = True,
+                 optimize: bool = False) -> 'DataAnalyzer':
+        """
+        Load a CSV file; unused columns are skipped and filters applied while
+        parsing (see from_parquet)
+        """
+        return cls._from_file(path, 'csv', columns, filters, memory_map, optimize)
+    
+    @classmethod
+    def chunked(cls, path: str, chunksize: int = 100_000) -> 'DataAnalyzer':
+        """
+        Create an analyzer that streams a CSV/Parquet file instead of loading it
+        
+        basic_statistics, correlation_analysis and generate_report read the
+        file once, chunk by chunk, into a StatsAccumulator. Memory use is
+        bounded by ``chunksize``. Medians are estimated with a QuantileSketch.
+        
+        Args:
+            path (str): CSV or Parquet file
+            chunksize (int): Rows per chunk
+        
+        Returns:
+            DataAnalyzer: Analyzer in chunked mode
+        """
+        analyzer = cls()
+        analyzer.source = path
+        analyzer.chunksize = chunksize
+        return analyzer
+    
+    def _require_data(self) -> None:
+        if not self._has_frame() and self.source is None:
+            raise ValueError("No data available. Please load or create data first.")
+    
+    def _accumulate_source(self) -> StatsAccumulator:
+        """
+        Single streaming pass over the source file, repeated only if the file changes
+        """
+        fingerprint = self._fingerprint()
+        if self._accumulator is None or self._accumulator[0] != fingerprint:
+            accumulator = StatsAccumulator()
+            for chunk in iter_file_chunks(self.source, self.chunksize):
+                accumulator.update(chunk)
+            self._accumulator = (fingerprint, accumulator)
+        return self._accumulator[1]
+    
+    def _overview(self) -> Tuple[Tuple[int, int], pd.Series, pd.Series]:
+        """
+        (shape, dtypes, missing values per column) of the dataset
+        """
+        accumulator = self._stats_accumulator()
+        if accumulator is None:
+            return self.data.shape, self.data.dtypes, self.data.isnull().sum()
+        return (accumulator.rows, len(accumulator.dtypes)), accumulator.dtypes, accumulator.missing
+    
+    def optimize_memory(self, category_ratio: float = 0.5, downcast_floats: bool = False,
+                        arrow_strings: bool = False) -> Dict:
+        """
+        Replace ``data`` with a compact dtype layout (see optimize_dtypes)
+        
+        Args:
+            category_ratio (float): Maximum distinct-to-rows ratio for a categorical
+            downcast_floats (bool): Also downcast losslessly representable floats
+            arrow_strings (bool): Store non-categorical strings as ``string[pyarrow]``
         
-    def create_sample_data(self) -> pd.DataFrame:
+        Returns:
+            Dict: Memory report, also kept as ``memory_report``
+        """
+        if not self._has_frame():
+            raise ValueError("No data available. Please load or create data first.")
+        self.data, report = optimize_dtypes(self.data, category_ratio, downcast_floats, arrow_strings)
+        self.memory_report = report
+        return report
+    
+    def create_sample_data(self, n_records: int = 1000, seed: int = 42, **options) -> pd.DataFrame:
         """
         Create a sample dataset for demonstration
         
+        Args:
+            n_records (int): Number of rows
+            seed (int): Seed for numpy.random.Generator streams (no global state)
+            **options: n_categories, n_regions, extra_numeric, missing_rate, days
+                (see iter_sales_data)
+        
         Returns:
             pd.DataFrame: Sample dataset
         """
-        np.random.seed(42)
-        
-        # Generate sample sales data
-        n_records = 1000
-        data = {
-            'date': pd.date_range('2023-01-01', periods=n_records, freq='D'),
-            'product_category': np.random.choice(['Electronics', 'Clothing', 'Books', 'Home', 'Sports'], n_records),
-            'sales_amount': np.random.normal(150, 50, n_records),
-            'quantity_sold': np.random.poisson(5, n_records),
-            'customer_age': np.random.normal(35, 12, n_records),
-            'customer_satisfaction': np.random.uniform(1, 5, n_records),
-            'region': np.random.choice(['North', 'South', 'East', 'West'], n_records)
-        }
-        
-        # Ensure positive values
-        data['sales_amount'] = np.abs(data['sales_amount'])
-        data['customer_age'] = np.clip(data['customer_age'], 18, 80)
-        
-        self.data = pd.DataFrame(data)
+        self.data = generate_sales_data(n_records, seed=seed, **options).reset_index(drop=True)
         return self.data
     
     def basic_statistics(self) -> Dict:
         """
         Calculate basic statistics for numerical columns
         
+        Results are memoized on the data fingerprint.
+        
         Returns:
             Dict: Dictionary containing statistics
         """
-        if self.data is None:
-            raise ValueError("No data available. Please load or create data first.")
-        
-        numerical_cols = self.data.select_dtypes(include=[np.number]).columns
-        stats = {}
-        
-        for col in numerical_cols:
-            stats[col] = {
-                'mean': self.data[col].mean(),
-                'median': self.data[col].median(),
-                'std': self.data[col].std(),
-                'min': self.data[col].min(),
-                'max': self.data[col].max(),
-                'count': self.data[col].count(),
-                'missing': self.data[col].isnull().sum()
-            }
-        
-        self.analysis_results['basic_stats'] = stats
-        return stats
+        self._require_data()
+        return self._cached('basic_stats', self._compute_basic_statistics)
+    
+    def _compute_basic_statistics(self) -> Dict:
+        accumulator = self._stats_accumulator()
+        if accumulator is not None:
+            return accumulator.statistics()
+        return describe_numeric(self.data)
     
     def correlation_analysis(self) -> pd.DataFrame:
         """
         Calculate correlation matrix for numerical columns
         
+        Results are memoized on the data fingerprint.
+        
         Returns:
             pd.DataFrame: Correlation matrix
         """
-        if self.data is None:
-            raise ValueError("No data available. Please load or create data first.")
-        
+        self._require_data()
+        return self._cached('correlation', self._compute_correlation)
+    
+    def _compute_correlation(self) -> pd.DataFrame:
+        accumulator = self._stats_accumulator()
+        if accumulator is not None:
+            return accumulator.correlation()
         numerical_data = self.data.select_dtypes(include=[np.number])
-        correlation_matrix = numerical_data.corr()
+        if numerical_data.shape[1] >= BLOCKED_CORRELATION_MIN_COLUMNS:
+            return blocked_correlation(numerical_data)
+        return numerical_data.corr()
+    
+    def write_correlation(self, path: str, block_size: int = 512,
+                          workers: Optional[int] = None) -> np.ndarray:
+        """
+        Compute the correlation matrix straight into a memory-mapped ``.npy`` file
+        
+        For very wide data, where the full matrix should not be held in
+        memory. The result is not cached.
+        
+        Args:
+            path (str): Output ``.npy`` path
+            block_size (int): Columns per tile side
+            workers (int): Threads computing tiles
         
-        self.analysis_results['correlation'] = correlation_matrix
-        return correlation_matrix
+        Returns:
+            np.ndarray: Memory-mapped matrix; column order follows the numeric columns of ``data``
+        """
+        if not self._has_frame():
+            raise ValueError("write_correlation needs in-memory data.")
+        return blocked_correlation(self.data, block_size=block_size, workers=workers, out=path)
     
-    def create_visualizations(self, save_plots: bool = True) -> None:
+    def group_totals(self, group: str, value: str = 'sales_amount') -> pd.Series:
+        """
+        Sum of ``value`` per ``group``
+        
+        Served from the running totals in append mode, otherwise computed
+        from the data and memoized.
+        
+        Args:
+            group (str): Column to group by
+            value (str): Column to sum
+        
+        Returns:
+            pd.Series: Totals indexed by group value
+        """
+        self._require_data()
+        running = self._running
+        if running is not None and running.group_totals_spec.get(group) == value and group in running.group_totals:
+            return running.group_total(group)
+        return self._cached(f'group_totals:{group}:{value}',
+                            lambda: self.data.groupby(group, observed=True)[value].sum(),
+                            columns=[group, value])
+    
+    def _panel_inputs(self, name: str) -> Any:
+        """
+        The summary one panel draws (bins, box stats, sampled points or
+        totals), so neither drawing nor workers ever see the raw rows
+        """
+        if name == 'category_sales':
+            return self.group_totals('product_category')
+        if name == 'daily_trend':
+            return self.group_totals('date')
+        if name == 'regional_sales':
+            return self.group_totals('region')
+        if name == 'correlation_heatmap':
+            return self.correlation_analysis()
+        if name == 'sales_distribution':
+            return histogram_summary(self.data['sales_amount'], bins=30)
+        if name == 'age_distribution':
+            return histogram_summary(self.data['customer_age'], bins=25)
+        if name == 'sales_by_category':
+            return box_summary(self.data, 'sales_amount', 'product_category')
+        x = {'satisfaction_vs_sales': 'customer_satisfaction', 'quantity_vs_sales': 'quantity_sold'}[name]
+        return sample_points(self.data[x], self.data['sales_amount'])
+    
+    def create_visualizations(self, save_plots: bool = True, headless: bool = False) -> None:
         """
         Create comprehensive visualizations
         
         Args:
             save_plots (bool): Whether to save plots to files
+            headless (bool): Render with the Agg backend and skip ``plt.show()``,
+                for servers and batch jobs
         """
         if self.data is None:
             raise ValueError("No data available. Please load or create data first.")
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 16))
-        
-        # 1. Sales Distribution
-        plt.subplot(3, 3, 1)
-        plt.hist(self.data['sales_amount'], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
-        plt.title('Sales Amount Distribution')
-        plt.xlabel('Sales Amount ($)')
-        plt.ylabel('Frequency')
-        
-        # 2. Sales by Category
-        plt.subplot(3, 3, 2)
-        category_sales = self.data.groupby('product_category')['sales_amount'].sum()
-        plt.pie(category_sales.values, labels=category_sales.index, autopct='%1.1f%%')
-        plt.title('Total Sales by Product Category')
-        
-        # 3. Sales Trend Over Time
-        plt.subplot(3, 3, 3)
-        daily_sales = self.data.groupby('date')['sales_amount'].sum()
-        plt.plot(daily_sales.index, daily_sales.values, linewidth=2)
-        plt.title('Daily Sales Trend')
-        plt.xlabel('Date')
-        plt.ylabel('Total Sales ($)')
-        plt.xticks(rotation=45)
-        
-        # 4. Correlation Heatmap
-        plt.subplot(3, 3, 4)
-        correlation_matrix = self.correlation_analysis()
-        sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0)
-        plt.title('Correlation Heatmap')
-        
-        # 5. Box Plot by Category
-        plt.subplot(3, 3, 5)
-        self.data.boxplot(column='sales_amount', by='product_category', ax=plt.gca())
-        plt.title('Sales Amount by Category')
-        plt.suptitle('')  # Remove default title
-        
-        # 6. Customer Age Distribution
-        plt.subplot(3, 3, 6)
-        plt.hist(self.data['customer_age'], bins=25, alpha=0.7, color='lightgreen', edgecolor='black')
-        plt.title('Customer Age Distribution')
-        plt.xlabel('Age')
-        plt.ylabel('Frequency')
-        
-        # 7. Satisfaction vs Sales Scatter
-        plt.subplot(3, 3, 7)
-        plt.scatter(self.data['customer_satisfaction'], self.data['sales_amount'], alpha=0.6)
-        plt.title('Customer Satisfaction vs Sales Amount')
-        plt.xlabel('Satisfaction Rating')
-        plt.ylabel('Sales Amount ($)')
-        
-        # 8. Regional Sales
-        plt.subplot(3, 3, 8)
-        regional_sales = self.data.groupby('region')['sales_amount'].sum()
-        plt.bar(regional_sales.index, regional_sales.values, color=['red', 'blue', 'green', 'orange'])
-        plt.title('Total Sales by Region')
-        plt.ylabel('Total Sales ($)')
-        
-        # 9. Quantity vs Sales
-        plt.subplot(3, 3, 9)
-        plt.scatter(self.data['quantity_sold'], self.data['sales_amount'], alpha=0.6, color='purple')
-        plt.title('Quantity Sold vs Sales Amount')
-        plt.xlabel('Quantity Sold')
-        plt.ylabel('Sales Amount ($)')
-        
-        plt.tight_layout()
+        plt, _ = _plotting('Agg' if headless else None)
+        fig = _draw_sheet({name: self._panel_inputs(name) for name in PANELS})
         
         if save_plots:
-            plt.savefig('data_analysis_plots.png', dpi=300, bbox_inches='tight')
+            fig.savefig('data_analysis_plots.png', dpi=300, bbox_inches='tight')
             print("Plots saved as 'data_analysis_plots.png'")
         
-        plt.show()
+        if headless:
+            plt.close(fig)
+        else:
+            plt.show()
     
-    def generate_report(self) -> str:
+    def panel_jobs(self, output_dir: str, formats: Union[str, Dict[str, str]] = 'png',
+                   dpi: Union[int, Dict[str, int]] = 150, composite: bool = True) -> List[Tuple]:
         """
-        Generate a comprehensive analysis report
+        Render jobs for every panel (and optionally the combined sheet)
+        
+        Args:
+            output_dir (str): Directory the files are written to (created if needed)
+            formats (Union[str, Dict[str, str]]): File format, or panel name -> format
+            dpi (Union[int, Dict[str, int]]): Resolution, or panel name -> resolution
+            composite (bool): Also render the combined sheet, named SHEET_NAME
         
         Returns:
-            str: Analysis report
+            List[Tuple]: Jobs for run_render_jobs
         """
         if self.data is None:
             raise ValueError("No data available. Please load or create data first.")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        def option(setting, name, default):
+            return setting.get(name, default) if isinstance(setting, dict) else setting
+        
+        inputs = {name: self._panel_inputs(name) for name in PANELS}
+        names = list(PANELS) + ([SHEET_NAME] if composite else [])
+        jobs = []
+        for name in names:
+            path = os.path.join(output_dir, f"{name}.{option(formats, name, 'png')}")
+            payload = inputs if name == SHEET_NAME else inputs[name]
+            jobs.append((name, payload, path, option(dpi, name, 150)))
+        return jobs
+    
+    def render_panels(self, output_dir: str = 'plots', formats: Union[str, Dict[str, str]] = 'png',
+                      dpi: Union[int, Dict[str, int]] = 150, composite: bool = True,
+                      workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Headless rendering of each panel to its own file, in a process pool
+        
+        Args:
+            output_dir (str): Directory the files are written to
+            formats (Union[str, Dict[str, str]]): File format, or panel name -> format
+            dpi (Union[int, Dict[str, int]]): Resolution, or panel name -> resolution
+            composite (bool): Also render the combined sheet
+            workers (int): Worker processes; defaults to the CPU count
+        
+        Returns:
+            Dict[str, str]: Panel name -> written path
+        """
+        jobs = self.panel_jobs(output_dir, formats, dpi, composite)
+        return dict(zip((job[0] for job in jobs), run_render_jobs(jobs, workers)))
+    
+    def generate_report(self, top_k: int = 5) -> str:
+        """
+        Generate a comprehensive analysis report
+        
+        The report and the analyses behind it are memoized on the data
+        fingerprint, so repeated calls on unchanged data are free.
         
+        Args:
+            top_k (int): Number of strongest correlations to list
+        
+        Returns:
+            str: Analysis report
+        """
+        self._require_data()
+        return self._cached(f'report:{top_k}', lambda: self._compute_report(top_k), missing=True)
+    
+    def _compute_report(self, top_k: int) -> str:
         # Calculate statistics
         stats = self.basic_statistics()
         correlation_matrix = self.correlation_analysis()
+        shape, dtypes, missing_values = self._overview()
         
         report = []
         report.append("=" * 60)
         report.append("DATA ANALYSIS REPORT")
         report.append("=" * 60)
-        report.append(f"Dataset Shape: {self.data.shape}")
-        report.append(f"Total Records: {len(self.data)}")
-        report.append(f"Total Columns: {len(self.data.columns)}")
+        report.append(f"Dataset Shape: {shape}")
+        report.append(f"Total Records: {shape[0]}")
+        report.append(f"Total Columns: {shape[1]}")
         report.append("")
         
         # Data types
         report.append("DATA TYPES:")
         report.append("-" * 20)
-        for col, dtype in self.data.dtypes.items():
+        for col, dtype in dtypes.items():
             report.append(f"{col}: {dtype}")
         report.append("")
         
         # Missing values
-        missing_values = self.data.isnull().sum()
         if missing_values.sum() > 0:
             report.append("MISSING VALUES:")
             report.append("-" * 20)
             for col, missing in missing_values.items():
                 if missing > 0:
-                    report.append(f"{col}: {missing} ({missing/len(self.data)*100:.1f}%)")
+                    report.append(f"{col}: {missing} ({missing/shape[0]*100:.1f}%)")
         else:
             report.append("No missing values found!")
         report.append("")
@@ -235,15 +1682,8 @@ class DataAnalyzer:
         # Top correlations
         report.append("\nTOP CORRELATIONS:")
         report.append("-" * 20)
-        correlations = []
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                corr_value = correlation_matrix.iloc[i, j]
-                correlations.append((correlation_matrix.columns[i], correlation_matrix.columns[j], corr_value))
-        
-        # Sort by absolute correlation value
-        correlations.sort(key=lambda x: abs(x[2]), reverse=True)
-        for var1, var2, corr in correlations[:5]:
+        correlations = top_correlations(correlation_matrix, k=top_k)
+        for var1, var2, corr in correlations.itertuples(index=False):
             report.append(f"{var1} vs {var2}: {corr:.3f}")
         
         return "\n".join(report)
@@ -0,0 +1,218 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from data_analysis import blocked_correlation, describe_numeric, top_correlations
+
+def make_frame(rows: int, columns: int, missing_rate: float = 0.01, seed: int = 42) -> pd.DataFrame:
+    """
+    Wide numeric frame with a sprinkling of missing values
+    
+    Args:
+        rows (int): Number of rows
+        columns (int): Number of numeric columns (half float, half integer)
+        missing_rate (float): Share of float values replaced by NaN
+        seed (int): Seed for numpy.random.Generator
+    
+    Returns:
+        pd.DataFrame: Synthetic dataset
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(columns):
+        if i % 2:
+            data[f"int_{i}"] = rng.poisson(5, rows)
+        else:
+            values = rng.normal(100, 25, rows)
+            values[rng.random(rows) < missing_rate] = np.nan
+            data[f"float_{i}"] = values
+    return pd.DataFrame(data)
+
+def time_call(func: Callable, repeat: int = 3) -> float:
+    """
+    Best-of-``repeat`` wall time of ``func()`` in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# --- Reference implementations ---
+
+def reference_basic_statistics(data: pd.DataFrame) -> Dict:
+    """
+    The original per-column basic_statistics, one pandas reduction per metric
+    """
+    numerical_cols = data.select_dtypes(include=[np.number]).columns
+    stats = {}
+    
+    for col in numerical_cols:
+        stats[col] = {
+            'mean': data[col].mean(),
+            'median': data[col].median(),
+            'std': data[col].std(),
+            'min': data[col].min(),
+            'max': data[col].max(),
+            'count': data[col].count(),
+            'missing': data[col].isnull().sum()
+        }
+    return stats
+
+def reference_top_correlations(correlation_matrix: pd.DataFrame, k: int = 5) -> List:
+    """
+    The original nested-loop extraction from generate_report
+    """
+    correlations = []
+    for i in range(len(correlation_matrix.columns)):
+        for j in range(i+1, len(correlation_matrix.columns)):
+            corr_value = correlation_matrix.iloc[i, j]
+            correlations.append((correlation_matrix.columns[i], correlation_matrix.columns[j], corr_value))
+    correlations.sort(key=lambda x: abs(x[2]), reverse=True)
+    return correlations[:k]
+
+def _stats_max_difference(expected: Dict, actual: Dict) -> float:
+    worst = 0.0
+    for col, metrics in expected.items():
+        for metric, value in metrics.items():
+            other = actual[col][metric]
+            if np.isnan(value) and np.isnan(other):
+                continue
+            worst = max(worst, abs(float(value) - float(other)) / max(1.0, abs(float(value))))
+    return worst
+
+# --- Benchmarks ---
+
+def benchmark_basic_statistics(frame: pd.DataFrame) -> Dict[str, float]:
+    """
+    Vectorized describe_numeric against the per-column reference
+    """
+    reference = time_call(lambda: reference_basic_statistics(frame))
+    vectorized = time_call(lambda: describe_numeric(frame))
+    return {
+        'reference_seconds': reference,
+        'vectorized_seconds': vectorized,
+        'speedup': reference / vectorized if vectorized > 0 else 0.0,
+        'max_relative_difference': _stats_max_difference(
+            reference_basic_statistics(frame), describe_numeric(frame)
+        ),
+    }
+
+def benchmark_top_correlations(frame: pd.DataFrame, width: int = 400) -> Dict[str, float]:
+    """
+    Vectorized top-k extraction against the nested loop, on a random
+    ``width`` x ``width`` correlation matrix
+    """
+    rng = np.random.default_rng(0)
+    names = [f"c{i}" for i in range(width)]
+    values = rng.uniform(-1, 1, (width, width))
+    matrix = pd.DataFrame((values + values.T) / 2, index=names, columns=names)
+    reference = time_call(lambda: reference_top_correlations(matrix), repeat=1)
+    vectorized = time_call(lambda: top_correlations(matrix))
+    expected = [(a, b) for a, b, _ in reference_top_correlations(matrix)]
+    actual = [(a, b) for a, b, _ in top_correlations(matrix).itertuples(index=False)]
+    return {
+        'width': width,
+        'reference_seconds': reference,
+        'vectorized_seconds': vectorized,
+        'speedup': reference / vectorized if vectorized > 0 else 0.0,
+        'same_pairs': float(expected == actual),
+    }
+
+def benchmark_blocked_correlation(frame: pd.DataFrame) -> Dict[str, float]:
+    """
+    Blocked, threaded correlation against ``DataFrame.corr()``
+    """
+    reference = time_call(frame.corr, repeat=1)
+    blocked = time_call(lambda: blocked_correlation(frame))
+    difference = np.abs(frame.corr().to_numpy() - blocked_correlation(frame).to_numpy())
+    return {
+        'reference_seconds': reference,
+        'blocked_seconds': blocked,
+        'speedup': reference / blocked if blocked > 0 else 0.0,
+        'max_abs_difference': float(np.nanmax(difference)),
+    }
+
+# Budget for ``import data_analysis`` (cumulative, from ``python -X importtime``)
+IMPORT_TIME_BUDGET_SECONDS = 0.8
+PLOTTING_MODULES = ('matplotlib', 'seaborn')
+
+def measure_import_time(module: str = 'data_analysis', repeat: int = 3) -> Dict[str, float]:
+    """
+    Best-of-``repeat`` cold import time of ``module`` in a fresh interpreter,
+    and whether the import pulled in the plotting stack
+    """
+    probe = (f"import sys, {module}; "
+             f"print(any(name in sys.modules for name in {PLOTTING_MODULES!r}))")
+    pattern = re.compile(rf"import time:\s+\d+ \|\s+(\d+) \| {re.escape(module)}$", re.MULTILINE)
+    best = float('inf')
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                                   capture_output=True, text=True, check=True,
+                                   cwd=os.path.dirname(os.path.abspath(__file__)))
+        best = min(best, int(pattern.search(completed.stderr).group(1)) / 1e6)
+    return {'seconds': best, 'plotting_loaded': float(completed.stdout.strip() == 'True')}
+
+def benchmark_import_time(frame: Optional[pd.DataFrame] = None) -> Dict[str, float]:
+    """
+    Startup cost of ``import data_analysis`` against IMPORT_TIME_BUDGET_SECONDS;
+    plotting libraries must not be imported until something is drawn
+    """
+    result = measure_import_time()
+    result['budget_seconds'] = IMPORT_TIME_BUDGET_SECONDS
+    result['within_budget'] = float(result['seconds'] <= IMPORT_TIME_BUDGET_SECONDS
+                                    and not result['plotting_loaded'])
+    return result
+
+BENCHMARKS = {
+    'basic_statistics': benchmark_basic_statistics,
+    'top_correlations': benchmark_top_correlations,
+    'blocked_correlation': benchmark_blocked_correlation,
+    'import_time': benchmark_import_time,
+}
+
+# Benchmarks that do not need the synthetic frame
+FRAMELESS_BENCHMARKS = {'import_time'}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DataAnalyzer building blocks.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="rows in the synthetic frame (default: 1000000)")
+    parser.add_argument('--columns', type=int, default=50, help="numeric columns (default: 50)")
+    parser.add_argument('--seed', type=int, default=42, help="data seed (default: 42)")
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append', help="run only these benchmarks")
+    parser.add_argument('-o', '--output', default='data_analysis_benchmark.json', help="where to write the JSON report")
+    args = parser.parse_args(argv)
+    
+    selected = args.only or list(BENCHMARKS)
+    frame = None
+    if set(selected) - FRAMELESS_BENCHMARKS:
+        frame = make_frame(args.rows, args.columns, seed=args.seed)
+    report = {'rows': args.rows, 'columns': args.columns, 'seed': args.seed, 'results': {}}
+    for name in selected:
+        result = BENCHMARKS[name](frame)
+        report['results'][name] = result
+        summary = ', '.join(f"{metric}={value:.4g}" for metric, value in result.items())
+        print(f"{name:<30} {summary}")
+    
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nReport written to {args.output}")
+    
+    startup = report['results'].get('import_time')
+    if startup is not None and not startup['within_budget']:
+        print(f"Import time budget exceeded: {startup['seconds']:.3f}s "
+              f"(budget {IMPORT_TIME_BUDGET_SECONDS:.3f}s, plotting loaded: {bool(startup['plotting_loaded'])})")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
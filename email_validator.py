@@ -1,94 +1,950 @@
+import argparse
+import csv
+import io
+import json
+import os
 import re
+import sys
+import threading
+import time
 import dns.resolver
-from typing import Tuple, Dict
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Tuple, Dict, Iterable, Iterator, List, Optional, TextIO, Union
 
-def validate_email(email: str) -> Tuple[bool, Dict[str, str]]:
+# Validation rules, compiled once at import time and shared by the
+# single-address and bulk validators.
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+DOMAIN_PATTERN = re.compile(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+INVALID_CHARS = ('<', '>', '"', "'", '\\', '|', ';', ':', '/', '*', '?', '=')
+INVALID_CHARS_PATTERN = re.compile('[' + re.escape(''.join(INVALID_CHARS)) + ']')
+# EMAIL_PATTERN split at its '@', for checking local part and domain separately
+LOCAL_PART_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+')
+
+MAX_EMAIL_LENGTH = 254  # RFC 5321 limit
+MIN_EMAIL_LENGTH = 5    # Minimum reasonable length
+
+class EmailCheck(IntFlag):
+    """Bit flags for the individual checks performed by validate_email"""
+    FORMAT = 1
+    DOMAIN = 2
+    LENGTH = 4
+    SPECIAL_CHARS = 8
+
+class EmailError(IntFlag):
+    """Bit flags for validation errors, in the order they are reported"""
+    EMPTY = 1
+    TOO_LONG = 2
+    TOO_SHORT = 4
+    INVALID_FORMAT = 8
+    INVALID_CHARS = 16
+    INVALID_DOMAIN = 32
+
+ALL_CHECKS = EmailCheck.FORMAT | EmailCheck.DOMAIN | EmailCheck.LENGTH | EmailCheck.SPECIAL_CHARS
+
+ERROR_MESSAGES = {
+    EmailError.EMPTY: "Email cannot be empty",
+    EmailError.TOO_LONG: "Email too long (max 254 characters)",
+    EmailError.TOO_SHORT: "Email too short (min 5 characters)",
+    EmailError.INVALID_FORMAT: "Invalid email format",
+    EmailError.INVALID_CHARS: "Email contains invalid characters",
+    EmailError.INVALID_DOMAIN: "Invalid domain format",
+}
+
+# Plain int aliases for the hot loop; IntFlag arithmetic is comparatively slow.
+_FORMAT, _DOMAIN, _LENGTH, _SPECIAL = (int(c) for c in EmailCheck)
+_EMPTY, _TOO_LONG, _TOO_SHORT, _BAD_FORMAT, _BAD_CHARS, _BAD_DOMAIN = (int(e) for e in EmailError)
+
+def _check_email(email) -> Tuple[int, int]:
     """
-    Comprehensive email validation function
+    Run every validation rule against a single address
+    
+    A full EMAIL_PATTERN match settles all four checks in one walk over the
+    string: its domain part is exactly what DOMAIN_PATTERN accepts, and none
+    of the characters it allows are in INVALID_CHARS. Only addresses that
+    fail the format check go on to the separate character and domain scans.
     
     Args:
-        email (str): Email address to validate
+        email: Email address to validate
         
     Returns:
-        Tuple[bool, Dict[str, str]]: (is_valid, validation_details)
+        Tuple[int, int]: (passed EmailCheck bits, EmailError bits)
     """
-    validation_results = {
-        'format_valid': False,
-        'domain_valid': False,
-        'length_valid': False,
-        'special_chars_valid': False,
-        'errors': []
-    }
-    
     # Check if email is not empty
     if not email or not isinstance(email, str):
-        validation_results['errors'].append("Email cannot be empty")
-        return False, validation_results
+        return 0, _EMPTY
     
     # Check length
-    if len(email) > 254:  # RFC 5321 limit
-        validation_results['errors'].append("Email too long (max 254 characters)")
-    elif len(email) < 5:  # Minimum reasonable length
-        validation_results['errors'].append("Email too short (min 5 characters)")
+    length = len(email)
+    if length > MAX_EMAIL_LENGTH:
+        checks, errors = 0, _TOO_LONG
+    elif length < MIN_EMAIL_LENGTH:
+        checks, errors = 0, _TOO_SHORT
     else:
-        validation_results['length_valid'] = True
+        checks, errors = _LENGTH, 0
     
     # Basic format validation using regex
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
-        validation_results['errors'].append("Invalid email format")
-    else:
-        validation_results['format_valid'] = True
+    if EMAIL_PATTERN.match(email):
+        return checks | _FORMAT | _SPECIAL | _DOMAIN, errors
+    errors |= _BAD_FORMAT
     
     # Check for valid special characters
-    invalid_chars = ['<', '>', '"', "'", '\\', '|', ';', ':', '/', '*', '?', '=']
-    if any(char in email for char in invalid_chars):
-        validation_results['errors'].append("Email contains invalid characters")
+    if INVALID_CHARS_PATTERN.search(email):
+        errors |= _BAD_CHARS
     else:
-        validation_results['special_chars_valid'] = True
+        checks |= _SPECIAL
     
     # Extract domain for additional validation
     if '@' in email:
-        domain = email.split('@')[1]
+        domain = email.split('@', 2)[1]
+        if DOMAIN_PATTERN.match(domain):
+            checks |= _DOMAIN
+        else:
+            errors |= _BAD_DOMAIN
+    
+    return checks, errors
+
+def _error_messages(errors: int) -> List[str]:
+    """
+    Render EmailError bits as human-readable messages, in report order
+    """
+    return [message for code, message in ERROR_MESSAGES.items() if errors & code]
+
+def _build_details(checks: int, errors: int) -> Tuple[bool, Dict[str, str]]:
+    """
+    Expand check/error bits into the (is_valid, details) shape of validate_email
+    """
+    validation_results = {
+        'format_valid': bool(checks & _FORMAT),
+        'domain_valid': bool(checks & _DOMAIN),
+        'length_valid': bool(checks & _LENGTH),
+        'special_chars_valid': bool(checks & _SPECIAL),
+        'errors': _error_messages(errors)
+    }
+    return checks == ALL_CHECKS, validation_results
+
+def validate_email(email: str) -> Tuple[bool, Dict[str, str]]:
+    """
+    Comprehensive email validation function
+    
+    Args:
+        email (str): Email address to validate
         
-        # Check domain format
-        domain_pattern = r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if re.match(domain_pattern, domain):
-            validation_results['domain_valid'] = True
+    Returns:
+        Tuple[bool, Dict[str, str]]: (is_valid, validation_details)
+    """
+    checks, errors = _check_email(email)
+    return _build_details(checks, errors)
+
+class EmailValidationResult:
+    """
+    Compact, immutable outcome of validating one address
+    
+    Holds only the EmailCheck and EmailError bits; flags and messages are
+    derived on access. Instances are shared between identical outcomes, so
+    storing millions of results costs one reference each.
+    """
+    __slots__ = ('checks', 'error_code')
+    _instances = {}
+    
+    def __init__(self, checks: int, error_code: int):
+        object.__setattr__(self, 'checks', EmailCheck(checks))
+        object.__setattr__(self, 'error_code', EmailError(error_code))
+    
+    @classmethod
+    def from_codes(cls, checks: int, error_code: int) -> 'EmailValidationResult':
+        """
+        Shared instance for the given check and error bits
+        """
+        key = (int(checks), int(error_code))
+        result = cls._instances.get(key)
+        if result is None:
+            result = cls._instances.setdefault(key, cls(*key))
+        return result
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+    
+    def __reduce__(self):
+        # Rebuild through from_codes so pickle/deepcopy bypass __setattr__
+        # and hand back the shared instance.
+        return (EmailValidationResult.from_codes, (int(self.checks), int(self.error_code)))
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, EmailValidationResult):
+            return NotImplemented
+        return self.checks == other.checks and self.error_code == other.error_code
+    
+    def __hash__(self) -> int:
+        return hash((int(self.checks), int(self.error_code)))
+    
+    def __repr__(self) -> str:
+        return f"EmailValidationResult(checks={self.checks!r}, error_code={self.error_code!r})"
+    
+    @property
+    def is_valid(self) -> bool:
+        return self.checks == ALL_CHECKS
+    
+    @property
+    def format_valid(self) -> bool:
+        return bool(self.checks & EmailCheck.FORMAT)
+    
+    @property
+    def domain_valid(self) -> bool:
+        return bool(self.checks & EmailCheck.DOMAIN)
+    
+    @property
+    def length_valid(self) -> bool:
+        return bool(self.checks & EmailCheck.LENGTH)
+    
+    @property
+    def special_chars_valid(self) -> bool:
+        return bool(self.checks & EmailCheck.SPECIAL_CHARS)
+    
+    @property
+    def error_codes(self) -> List[EmailError]:
+        """Individual error codes, in report order"""
+        return [code for code in ERROR_MESSAGES if self.error_code & code]
+    
+    @property
+    def errors(self) -> List[str]:
+        """Human-readable error messages, rendered on demand"""
+        return _error_messages(self.error_code)
+    
+    def to_dict(self) -> Dict[str, str]:
+        """
+        The validation_details dict that validate_email returns
+        """
+        return _build_details(self.checks, self.error_code)[1]
+    
+    def as_tuple(self) -> Tuple[bool, Dict[str, str]]:
+        """
+        The (is_valid, validation_details) tuple that validate_email returns
+        """
+        return _build_details(self.checks, self.error_code)
+
+def validate_email_compact(email: str) -> EmailValidationResult:
+    """
+    Memory-efficient variant of validate_email
+    
+    Args:
+        email (str): Email address to validate
+        
+    Returns:
+        EmailValidationResult: Shared result object; call ``as_tuple()`` for
+        the validate_email return shape
+    """
+    return EmailValidationResult.from_codes(*_check_email(email))
+
+@dataclass
+class BulkValidationResult:
+    """
+    Columnar validation results for a batch of addresses
+    
+    Each attribute holds one entry per input address, in input order.
+    """
+    format_valid: np.ndarray
+    domain_valid: np.ndarray
+    length_valid: np.ndarray
+    special_chars_valid: np.ndarray
+    error_codes: np.ndarray  # uint8 EmailError bits
+    
+    @classmethod
+    def from_codes(cls, checks: np.ndarray, errors: np.ndarray) -> 'BulkValidationResult':
+        """
+        Build the columns from parallel arrays of EmailCheck and EmailError bits
+        """
+        checks = np.asarray(checks, dtype=np.uint8)
+        return cls(
+            format_valid=(checks & _FORMAT) != 0,
+            domain_valid=(checks & _DOMAIN) != 0,
+            length_valid=(checks & _LENGTH) != 0,
+            special_chars_valid=(checks & _SPECIAL) != 0,
+            error_codes=np.asarray(errors, dtype=np.uint8)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.error_codes)
+    
+    @property
+    def is_valid(self) -> np.ndarray:
+        """Overall validity per address"""
+        return self.format_valid & self.domain_valid & self.length_valid & self.special_chars_valid
+    
+    def errors(self, index: int) -> List[str]:
+        """Error messages for the address at ``index``"""
+        return _error_messages(int(self.error_codes[index]))
+    
+    def details(self, index: int) -> Tuple[bool, Dict[str, str]]:
+        """
+        Result for the address at ``index`` in the same shape validate_email returns
+        """
+        return self.result(index).as_tuple()
+    
+    def result(self, index: int) -> EmailValidationResult:
+        """Compact result object for the address at ``index``"""
+        checks = (
+            _FORMAT * bool(self.format_valid[index])
+            | _DOMAIN * bool(self.domain_valid[index])
+            | _LENGTH * bool(self.length_valid[index])
+            | _SPECIAL * bool(self.special_chars_valid[index])
+        )
+        return EmailValidationResult.from_codes(checks, int(self.error_codes[index]))
+
+def validate_emails(emails: Iterable[str]) -> BulkValidationResult:
+    """
+    Validate many email addresses in one call
+    
+    Applies exactly the rules of validate_email, but stores the outcome as
+    one byte of check bits and one byte of error bits per address instead
+    of a dict of lists.
+    
+    Args:
+        emails (Iterable[str]): Email addresses to validate
+        
+    Returns:
+        BulkValidationResult: Columnar results in input order
+    """
+    checks = bytearray()
+    errors = bytearray()
+    for email in emails:
+        passed, failed = _check_email(email)
+        checks.append(passed)
+        errors.append(failed)
+    return BulkValidationResult.from_codes(
+        np.frombuffer(checks, dtype=np.uint8), np.frombuffer(errors, dtype=np.uint8)
+    )
+
+def validate_email_series(emails) -> BulkValidationResult:
+    """
+    Vectorized validation of a pandas Series of email addresses
+    
+    Uses the ``Series.str`` accessors instead of a per-address Python loop.
+    Results match validate_email for every element, including non-string
+    and missing values, which are reported as empty.
+    
+    Args:
+        emails (pd.Series): Email addresses to validate
+        
+    Returns:
+        BulkValidationResult: Columnar results in Series order
+    """
+    # Object dtype keeps Python ``re`` semantics (Arrow-backed strings use RE2,
+    # which treats '$' differently around a trailing newline).
+    emails = emails.astype(object)
+    is_str = emails.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    if not is_str.any():
+        # The .str accessors refuse a Series without any strings
+        return BulkValidationResult.from_codes(np.zeros(len(emails), dtype=np.uint8),
+                                               np.full(len(emails), _EMPTY, dtype=np.uint8))
+    lengths = emails.str.len().fillna(0).to_numpy(dtype=np.int64)
+    present = is_str & (lengths > 0)
+    
+    too_long = present & (lengths > MAX_EMAIL_LENGTH)
+    too_short = present & (lengths < MIN_EMAIL_LENGTH)
+    format_ok = emails.str.match(EMAIL_PATTERN).fillna(False).to_numpy(dtype=bool)
+    has_bad_chars = emails.str.contains(INVALID_CHARS_PATTERN).fillna(False).to_numpy(dtype=bool)
+    has_at = emails.str.contains('@', regex=False).fillna(False).to_numpy(dtype=bool)
+    domain_ok = (
+        emails.str.split('@').str[1].str.match(DOMAIN_PATTERN).fillna(False).to_numpy(dtype=bool)
+    )
+    
+    checks = np.zeros(len(emails), dtype=np.uint8)
+    checks[present & ~too_long & ~too_short] |= _LENGTH
+    checks[present & format_ok] |= _FORMAT
+    checks[present & ~has_bad_chars] |= _SPECIAL
+    checks[present & has_at & domain_ok] |= _DOMAIN
+    
+    errors = np.zeros(len(emails), dtype=np.uint8)
+    errors[~present] |= _EMPTY
+    errors[too_long] |= _TOO_LONG
+    errors[too_short] |= _TOO_SHORT
+    errors[present & ~format_ok] |= _BAD_FORMAT
+    errors[present & has_bad_chars] |= _BAD_CHARS
+    errors[present & has_at & ~domain_ok] |= _BAD_DOMAIN
+    
+    return BulkValidationResult.from_codes(checks, errors)
+
+def read_email_chunks(path: str, chunk_size: int = 10000,
+                      column: Optional[str] = None) -> Iterator[List[str]]:
+    """
+    Lazily read email addresses from a file in fixed-size chunks
+    
+    Args:
+        path (str): Newline-delimited text file, or a CSV file when ``column`` is given
+        chunk_size (int): Maximum number of addresses per chunk
+        column (str): Name of the CSV header column holding the addresses
+        
+    Yields:
+        List[str]: Up to ``chunk_size`` addresses, in file order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    
+    with open(path, newline='', encoding='utf-8') as handle:
+        if column is None:
+            # Only the line terminator is stripped; whitespace is part of the address
+            rows = (line.rstrip('\r\n') for line in handle)
         else:
-            validation_results['errors'].append("Invalid domain format")
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            if column not in header:
+                raise ValueError(f"Column '{column}' not found in {path}")
+            index = header.index(column)
+            rows = (row[index] if index < len(row) else '' for row in reader)
+        
+        chunk = []
+        for email in rows:
+            chunk.append(email)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def _write_results(writer, emails: List[str], results: BulkValidationResult) -> int:
+    """
+    Write one chunk of results as CSV rows and return how many were valid
+    """
+    is_valid = results.is_valid
+    for i, email in enumerate(emails):
+        writer.writerow([email, bool(is_valid[i]), '; '.join(results.errors(i))])
+    return int(is_valid.sum())
+
+def validate_email_file(input_path: str, output: Union[str, TextIO], chunk_size: int = 10000,
+                        column: Optional[str] = None) -> Dict[str, float]:
+    """
+    Stream-validate a file of email addresses into a CSV sink
     
-    # Determine overall validity
-    is_valid = all([
-        validation_results['format_valid'],
-        validation_results['domain_valid'],
-        validation_results['length_valid'],
-        validation_results['special_chars_valid']
-    ])
+    Only one chunk is held in memory at a time, so memory use is bounded by
+    ``chunk_size`` rather than the input size. Each output row holds
+    ``email,is_valid,errors`` with the same verdict and messages that
+    validate_email gives for that address.
     
-    return is_valid, validation_results
+    Args:
+        input_path (str): Input file (see read_email_chunks)
+        output (Union[str, TextIO]): Output CSV path or an open text file
+        chunk_size (int): Addresses validated per chunk
+        column (str): CSV column holding the addresses, if the input is CSV
+        
+    Returns:
+        Dict[str, float]: Totals, elapsed seconds and throughput in addresses/sec
+    """
+    stats = {'total': 0, 'valid': 0, 'invalid': 0}
+    start = time.perf_counter()
+    
+    sink = open(output, 'w', newline='', encoding='utf-8') if isinstance(output, str) else output
+    try:
+        writer = csv.writer(sink)
+        writer.writerow(['email', 'is_valid', 'errors'])
+        for chunk in read_email_chunks(input_path, chunk_size, column):
+            valid = _write_results(writer, chunk, validate_emails(chunk))
+            stats['total'] += len(chunk)
+            stats['valid'] += valid
+            stats['invalid'] += len(chunk) - valid
+    finally:
+        if sink is not output:
+            sink.close()
+    
+    elapsed = time.perf_counter() - start
+    stats['elapsed_seconds'] = elapsed
+    stats['addresses_per_sec'] = stats['total'] / elapsed if elapsed > 0 else 0.0
+    return stats
+
+def _email_domain(email: str) -> Optional[str]:
+    """
+    Domain part used for MX lookups, or None if the address has no '@'
+    """
+    try:
+        return email.split('@')[1]
+    except (AttributeError, IndexError):
+        return None
+
+class MXCache:
+    """
+    Thread-safe, TTL-aware LRU cache of MX lookup outcomes keyed by domain
+    
+    Expired entries are dropped when they are next read or by purge_expired();
+    once ``max_size`` is reached the least recently used domain is evicted.
+    """
+    
+    def __init__(self, max_size: int = 100000, clock=time.monotonic):
+        """
+        Args:
+            max_size (int): Maximum number of domains kept
+            clock: Monotonic time source, in seconds
+        """
+        self.max_size = max_size
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, domain: str) -> Optional[bool]:
+        """
+        Cached MX verdict for ``domain``, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return None
+            has_mx, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[domain]
+                return None
+            self._entries.move_to_end(domain)
+            return has_mx
+    
+    def put(self, domain: str, has_mx: bool, ttl: float) -> None:
+        """
+        Cache a verdict for ``ttl`` seconds (non-positive TTLs are not cached)
+        """
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[domain] = (has_mx, self._clock() + ttl)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry and return how many were removed
+        """
+        with self._lock:
+            now = self._clock()
+            expired = [domain for domain, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for domain in expired:
+                del self._entries[domain]
+            return len(expired)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
-def validate_email_dns(email: str) -> bool:
+class MXValidator:
+    """
+    MX record validator with a shared resolver, a TTL cache and bounded concurrency
+    
+    Any object with a ``resolve(domain, 'MX')`` method can serve as the
+    resolver, e.g. a ``dns.resolver.Resolver(configure=False)`` pointed at a
+    local stub server, or a fake that returns canned answers.
+    """
+    
+    def __init__(self, resolver=None, max_in_flight: int = 32, timeout: float = 5.0,
+                 cache: Optional[MXCache] = None, negative_ttl: float = 300.0,
+                 error_ttl: float = 30.0, min_ttl: float = 60.0, max_ttl: float = 86400.0):
+        """
+        Args:
+            resolver: Resolver to query; defaults to the system dnspython resolver
+            max_in_flight (int): Maximum number of concurrent DNS queries
+            timeout (float): Query lifetime in seconds for the default resolver
+            cache (MXCache): Cache to use; a new one is created if omitted
+            negative_ttl (float): Seconds to cache NXDOMAIN / NoAnswer results
+            error_ttl (float): Seconds to cache timeouts and other failures
+            min_ttl (float): Lower bound applied to positive answer TTLs
+            max_ttl (float): Upper bound applied to positive answer TTLs
+        """
+        if resolver is None:
+            resolver = dns.resolver.Resolver()
+            resolver.lifetime = timeout
+        self.resolver = resolver
+        self.max_in_flight = max(1, max_in_flight)
+        self.cache = cache if cache is not None else MXCache()
+        self.negative_ttl = negative_ttl
+        self.error_ttl = error_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+    
+    def _resolve(self, domain: str) -> Tuple[bool, float]:
+        """
+        Query the resolver and return (has_mx, ttl to cache the verdict for)
+        """
+        try:
+            answer = self.resolver.resolve(domain, 'MX')
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return False, self.negative_ttl
+        except Exception:
+            return False, self.error_ttl
+        
+        ttl = getattr(getattr(answer, 'rrset', None), 'ttl', None)
+        if ttl is None:
+            ttl = self.max_ttl
+        return True, min(max(ttl, self.min_ttl), self.max_ttl)
+    
+    def has_mx(self, domain: str) -> bool:
+        """
+        True if ``domain`` has MX records, answered from the cache when possible
+        """
+        cached = self.cache.get(domain)
+        if cached is not None:
+            return cached
+        has_mx, ttl = self._resolve(domain)
+        self.cache.put(domain, has_mx, ttl)
+        return has_mx
+    
+    def validate_email(self, email: str) -> bool:
+        """
+        Same verdict as validate_email_dns, using this validator's cache and resolver
+        """
+        domain = _email_domain(email)
+        return domain is not None and self.has_mx(domain)
+    
+    def validate_emails(self, emails: Iterable[str]) -> List[bool]:
+        """
+        Validate many addresses, resolving each distinct domain at most once
+        
+        Args:
+            emails (Iterable[str]): Email addresses to validate
+            
+        Returns:
+            List[bool]: MX verdict per address, in input order
+        """
+        domains = [_email_domain(email) for email in emails]
+        verdicts = {}
+        pending = []
+        for domain in set(domains):
+            if domain is None:
+                continue
+            cached = self.cache.get(domain)
+            if cached is None:
+                pending.append(domain)
+            else:
+                verdicts[domain] = cached
+        
+        if pending:
+            workers = min(self.max_in_flight, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for domain, (has_mx, ttl) in zip(pending, pool.map(self._resolve, pending)):
+                    self.cache.put(domain, has_mx, ttl)
+                    verdicts[domain] = has_mx
+        
+        return [domain is not None and verdicts[domain] for domain in domains]
+
+_shared_mx_validator = None
+_shared_mx_validator_lock = threading.Lock()
+
+def get_mx_validator() -> MXValidator:
+    """
+    Process-wide MXValidator shared by validate_email_dns and validate_emails_dns
+    """
+    global _shared_mx_validator
+    with _shared_mx_validator_lock:
+        if _shared_mx_validator is None:
+            _shared_mx_validator = MXValidator()
+        return _shared_mx_validator
+
+def validate_email_dns(email: str, validator: Optional[MXValidator] = None) -> bool:
     """
     Validate email domain using DNS lookup (optional advanced validation)
     
     Args:
         email (str): Email address to validate
+        validator (MXValidator): Validator to use; defaults to the shared one
         
     Returns:
         bool: True if domain has valid MX records
     """
+    return (validator or get_mx_validator()).validate_email(email)
+
+def validate_emails_dns(emails: Iterable[str], validator: Optional[MXValidator] = None) -> List[bool]:
+    """
+    Concurrent, deduplicated DNS validation for a batch of addresses
+    
+    Args:
+        emails (Iterable[str]): Email addresses to validate
+        validator (MXValidator): Validator to use; defaults to the shared one
+        
+    Returns:
+        List[bool]: True per address whose domain has valid MX records
+    """
+    return (validator or get_mx_validator()).validate_emails(emails)
+
+@dataclass
+class DomainStats:
+    """Per-domain figures collected by validate_emails_by_domain"""
+    domain: str
+    addresses: int = 0
+    valid: int = 0
+    has_mx: Optional[bool] = None
+    lookup_seconds: float = 0.0
+    
+    @property
+    def validity_rate(self) -> float:
+        """Share of this domain's addresses that passed every check"""
+        return self.valid / self.addresses if self.addresses else 0.0
+
+@dataclass
+class DomainBatchReport:
+    """Result of validate_emails_by_domain"""
+    results: BulkValidationResult
+    mx_valid: Optional[np.ndarray]  # None when DNS checks were skipped
+    domains: Dict[str, DomainStats]
+    
+    @property
+    def is_valid(self) -> np.ndarray:
+        """Syntactic validity combined with the MX verdict, if one was computed"""
+        valid = self.results.is_valid
+        if self.mx_valid is not None:
+            valid = valid & self.mx_valid
+        return valid
+    
+    def top_domains(self, n: int = 10) -> List[DomainStats]:
+        """The ``n`` domains with the most addresses"""
+        return sorted(self.domains.values(), key=lambda stats: stats.addresses, reverse=True)[:n]
+
+def _timed_has_mx(validator: MXValidator, domain: str) -> Tuple[bool, float]:
+    start = time.perf_counter()
+    has_mx = validator.has_mx(domain)
+    return has_mx, time.perf_counter() - start
+
+def validate_emails_by_domain(emails: Iterable[str], check_dns: bool = True,
+                              validator: Optional[MXValidator] = None) -> DomainBatchReport:
+    """
+    Validate a batch with domain-level work done once per distinct domain
+    
+    Each address is split into local part and domain up front. The domain
+    regex, the domain's invalid-character scan and the MX lookup run once
+    per distinct domain; only the local-part and length checks run per
+    address. The syntactic results are identical to validate_email.
+    
+    MX lookups are skipped for domains that fail the domain regex; their
+    addresses get an MX verdict of False.
+    
+    Args:
+        emails (Iterable[str]): Email addresses to validate
+        check_dns (bool): Whether to look up MX records as well
+        validator (MXValidator): Validator for MX lookups; defaults to the shared one
+        
+    Returns:
+        DomainBatchReport: Per-address results plus per-domain statistics
+    """
+    emails = list(emails)
+    checks = bytearray(len(emails))
+    errors = bytearray(len(emails))
+    address_domains = [None] * len(emails)
+    domain_rules = {}  # domain -> (matches DOMAIN_PATTERN, contains invalid chars)
+    
+    for i, email in enumerate(emails):
+        if not isinstance(email, str) or '@' not in email:
+            checks[i], errors[i] = _check_email(email)
+            continue
+        
+        local, _, rest = email.partition('@')
+        domain, extra_at, tail = rest.partition('@')
+        rules = domain_rules.get(domain)
+        if rules is None:
+            rules = domain_rules[domain] = (
+                DOMAIN_PATTERN.match(domain) is not None,
+                INVALID_CHARS_PATTERN.search(domain) is not None
+            )
+        domain_ok, domain_has_bad_chars = rules
+        address_domains[i] = domain
+        
+        passed = 0
+        failed = 0
+        if len(email) > MAX_EMAIL_LENGTH:
+            failed |= _TOO_LONG
+        elif len(email) < MIN_EMAIL_LENGTH:
+            failed |= _TOO_SHORT
+        else:
+            passed |= _LENGTH
+        
+        # EMAIL_PATTERN allows exactly one '@' between a valid local part and domain
+        if domain_ok and not extra_at and LOCAL_PART_PATTERN.fullmatch(local):
+            passed |= _FORMAT
+        else:
+            failed |= _BAD_FORMAT
+        
+        if (domain_has_bad_chars or INVALID_CHARS_PATTERN.search(local)
+                or (extra_at and INVALID_CHARS_PATTERN.search(tail))):
+            failed |= _BAD_CHARS
+        else:
+            passed |= _SPECIAL
+        
+        if domain_ok:
+            passed |= _DOMAIN
+        else:
+            failed |= _BAD_DOMAIN
+        
+        checks[i] = passed
+        errors[i] = failed
+    
+    results = BulkValidationResult.from_codes(
+        np.frombuffer(checks, dtype=np.uint8), np.frombuffer(errors, dtype=np.uint8)
+    )
+    stats = {domain: DomainStats(domain) for domain in domain_rules}
+    
+    mx_valid = None
+    if check_dns:
+        validator = validator or get_mx_validator()
+        lookups = [domain for domain, (domain_ok, _) in domain_rules.items() if domain_ok]
+        if lookups:
+            workers = min(validator.max_in_flight, len(lookups))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                timed = pool.map(lambda domain: _timed_has_mx(validator, domain), lookups)
+                for domain, (has_mx, seconds) in zip(lookups, timed):
+                    stats[domain].has_mx = has_mx
+                    stats[domain].lookup_seconds = seconds
+        mx_valid = np.fromiter(
+            (domain is not None and bool(stats[domain].has_mx) for domain in address_domains),
+            dtype=bool, count=len(emails)
+        )
+    
+    report = DomainBatchReport(results=results, mx_valid=mx_valid, domains=stats)
+    is_valid = report.is_valid
+    for i, domain in enumerate(address_domains):
+        if domain is not None:
+            stats[domain].addresses += 1
+            stats[domain].valid += bool(is_valid[i])
+    return report
+
+def _validate_chunk(emails: List[str]) -> Tuple[bytes, int, int]:
+    """
+    Worker task: validate one chunk and render its CSV rows
+    
+    Returns:
+        Tuple[bytes, int, int]: (UTF-8 CSV rows, addresses, valid addresses)
+    """
+    buffer = io.StringIO(newline='')
+    valid = _write_results(csv.writer(buffer), emails, validate_emails(emails))
+    return buffer.getvalue().encode('utf-8'), len(emails), valid
+
+def _load_checkpoint(checkpoint_path: Optional[str], run: Dict) -> Optional[Dict]:
+    """
+    Saved progress for this exact run, or None if there is nothing to resume
+    """
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path, encoding='utf-8') as handle:
+        state = json.load(handle)
+    if state.get('run') != run:
+        raise ValueError(f"Checkpoint {checkpoint_path} belongs to a different run: {state.get('run')}")
+    return state
+
+def _save_checkpoint(checkpoint_path: str, state: Dict) -> None:
+    """
+    Atomically replace the checkpoint file
+    """
+    temp_path = checkpoint_path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(state, handle)
+    os.replace(temp_path, checkpoint_path)
+
+def validate_email_file_parallel(input_path: str, output_path: str, chunk_size: int = 10000,
+                                 workers: Optional[int] = None, ordered: bool = True,
+                                 column: Optional[str] = None,
+                                 checkpoint_path: Optional[str] = None) -> Dict[str, float]:
+    """
+    Validate a file across a pool of worker processes
+    
+    The input is read in chunks (see read_email_chunks) and each chunk is
+    validated and rendered to CSV rows in a worker. At most two chunks per
+    worker are in flight, so memory stays bounded.
+    
+    With a checkpoint file, progress is saved after every chunk that is
+    written, together with the output size at that point. Re-running with
+    the same arguments truncates any partially written output and skips
+    the chunks that are already done. The checkpoint is removed once the
+    run completes.
+    
+    Args:
+        input_path (str): Input file of addresses
+        output_path (str): Output CSV path (email,is_valid,errors)
+        chunk_size (int): Addresses per chunk
+        workers (int): Worker processes; defaults to the CPU count
+        ordered (bool): Keep output rows in input order; otherwise write chunks as they finish
+        column (str): CSV column holding the addresses, if the input is CSV
+        checkpoint_path (str): Where to save progress for resuming
+        
+    Returns:
+        Dict[str, float]: Totals, elapsed seconds and throughput in addresses/sec
+    """
+    workers = workers or os.cpu_count() or 1
+    run = {'input': os.path.abspath(input_path), 'output': os.path.abspath(output_path),
+           'chunk_size': chunk_size, 'column': column, 'ordered': ordered}
+    state = _load_checkpoint(checkpoint_path, run)
+    if state is None:
+        state = {'run': run, 'completed': [], 'output_bytes': 0, 'total': 0, 'valid': 0}
+        sink = open(output_path, 'wb')
+        sink.write(b'email,is_valid,errors\r\n')
+    else:
+        sink = open(output_path, 'r+b')
+        sink.truncate(state['output_bytes'])
+        sink.seek(state['output_bytes'])
+    
+    completed = set(state['completed'])
+    resumed_total = state['total']
+    next_index = 0  # first chunk not yet written, in ordered mode
+    while next_index in completed:
+        next_index += 1
+    finished = {}  # chunk index -> worker result, buffered until it can be written
+    pending = {}   # future -> chunk index
+    start = time.perf_counter()
+    
+    def write_chunk(index, result):
+        rows, total, valid = result
+        sink.write(rows)
+        completed.add(index)
+        state['total'] += total
+        state['valid'] += valid
+        if checkpoint_path:
+            sink.flush()
+            state['output_bytes'] = sink.tell()
+            state['completed'] = sorted(completed)
+            _save_checkpoint(checkpoint_path, state)
+    
+    def collect(done):
+        nonlocal next_index
+        for future in done:
+            index = pending.pop(future)
+            if ordered:
+                finished[index] = future.result()
+            else:
+                write_chunk(index, future.result())
+        while next_index in finished:
+            write_chunk(next_index, finished.pop(next_index))
+            next_index += 1
+            while next_index in completed:
+                next_index += 1
+    
     try:
-        domain = email.split('@')[1]
-        dns.resolver.resolve(domain, 'MX')
-        return True
-    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout):
-        return False
-    except Exception:
-        return False
-
-# Example usage and testing
-if __name__ == "__main__":
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for index, chunk in enumerate(read_email_chunks(input_path, chunk_size, column)):
+                if index in completed:
+                    continue
+                pending[pool.submit(_validate_chunk, chunk)] = index
+                if len(pending) + len(finished) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+    finally:
+        sink.close()
+    
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    
+    elapsed = time.perf_counter() - start
+    processed = state['total'] - resumed_total
+    return {
+        'total': state['total'],
+        'valid': state['valid'],
+        'invalid': state['total'] - state['valid'],
+        'elapsed_seconds': elapsed,
+        'addresses_per_sec': processed / elapsed if elapsed > 0 else 0.0
+    }
+
+def _run_demo() -> None:
+    """
+    Print validation results for a handful of sample addresses
+    """
     test_emails = [
         "user@example.com",
         "invalid-email",
@@ -114,4 +970,40 @@ if __name__ == "__main__":
         if not is_valid and details['errors']:
             for error in details['errors']:
                 print(f"  └─ {error}")
-        print() 
\ No newline at end of file
+        print()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point
+    
+    Without an input file, runs the sample-address demo.
+    """
+    parser = argparse.ArgumentParser(description="Validate email addresses from a file.")
+    parser.add_argument('input', nargs='?', help="newline-delimited or CSV file of addresses")
+    parser.add_argument('-o', '--output', help="output CSV (default: <input>.results.csv)")
+    parser.add_argument('--column', help="CSV column holding the addresses")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="addresses per chunk (default: 10000)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--unordered', action='store_true', help="write chunks as they finish instead of in input order")
+    parser.add_argument('--checkpoint', help="checkpoint file for resuming an interrupted run")
+    args = parser.parse_args(argv)
+    
+    if args.input is None:
+        _run_demo()
+        return 0
+    
+    stats = validate_email_file_parallel(
+        args.input,
+        args.output or args.input + '.results.csv',
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        ordered=not args.unordered,
+        column=args.column,
+        checkpoint_path=args.checkpoint
+    )
+    print(f"Validated {stats['total']} addresses: {stats['valid']} valid, {stats['invalid']} invalid "
+          f"({stats['addresses_per_sec']:.0f} addresses/sec)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
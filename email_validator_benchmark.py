@@ -0,0 +1,380 @@
+import argparse
+import json
+import platform
+import random
+import re
+import statistics
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import dns.resolver
+import pandas as pd
+
+from email_validator import (
+    MXValidator,
+    validate_email,
+    validate_email_dns,
+    validate_email_series,
+    validate_emails,
+    validate_emails_by_domain,
+    validate_emails_dns,
+)
+
+SHARED_DOMAINS = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com', 'icloud.com']
+LOCAL_CHARS = string.ascii_letters + string.digits + '._%+-'
+UNICODE_CHARS = 'äöüßéèçñøåæ日本語中文ğşıžčćπλ'
+INVALID_CHARS = '<>"\'\\|;:/*?= '
+
+# --- Synthetic corpora ---
+
+def _local_part(rng: random.Random, min_len: int = 3, max_len: int = 20) -> str:
+    return ''.join(rng.choice(LOCAL_CHARS) for _ in range(rng.randint(min_len, max_len)))
+
+def _domain(rng: random.Random) -> str:
+    label = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12)))
+    return f"{label}.{rng.choice(['com', 'org', 'net', 'io', 'co.uk'])}"
+
+def _long_domain(rng: random.Random) -> str:
+    labels = (''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(10, 30)))
+              for _ in range(rng.randint(2, 4)))
+    return '.'.join(labels) + '.com'
+
+def make_corpora(size: int, seed: int = 42) -> Dict[str, List[str]]:
+    """
+    Build reproducible address corpora for benchmarking
+    
+    Args:
+        size (int): Addresses per corpus
+        seed (int): Seed for the corpus generator
+    
+    Returns:
+        Dict[str, List[str]]: Corpus name -> addresses
+    """
+    rng = random.Random(seed)
+    corpora = {
+        'valid': [f"{_local_part(rng)}@{_domain(rng)}" for _ in range(size)],
+        'invalid': [],
+        'long': [f"{_local_part(rng, 100, 200)}@{_long_domain(rng)}" for _ in range(size)],
+        'unicode': [],
+        'shared_domains': [f"{_local_part(rng)}@{rng.choice(SHARED_DOMAINS)}" for _ in range(size)],
+    }
+    for _ in range(size):
+        email = f"{_local_part(rng)}@{_domain(rng)}"
+        position = rng.randrange(len(email))
+        mutation = rng.randrange(4)
+        if mutation == 0:
+            email = email.replace('@', '')
+        elif mutation == 1:
+            email = email[:position] + rng.choice(INVALID_CHARS) + email[position:]
+        elif mutation == 2:
+            email = email.split('@')[0] + '@' + email.split('@')[1].split('.')[0]
+        else:
+            email = email[:position] + '@' + email[position:]
+        corpora['invalid'].append(email)
+    for _ in range(size):
+        local = ''.join(rng.choice(LOCAL_CHARS + UNICODE_CHARS) for _ in range(rng.randint(3, 20)))
+        corpora['unicode'].append(f"{local}@{_domain(rng)}")
+    return corpora
+
+# --- Measurements ---
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    """
+    Latency summary in microseconds
+    """
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        'p50_us': cuts[49] * 1e6,
+        'p90_us': cuts[89] * 1e6,
+        'p99_us': cuts[98] * 1e6,
+        'mean_us': statistics.fmean(samples) * 1e6,
+    }
+
+def measure_latency(func: Callable, emails: List[str]) -> Dict[str, float]:
+    """
+    Per-call latency percentiles of ``func`` over ``emails``
+    """
+    timer = time.perf_counter
+    samples = []
+    for email in emails:
+        start = timer()
+        func(email)
+        samples.append(timer() - start)
+    return _percentiles(samples)
+
+def measure_throughput(func: Callable, emails: List[str], repeat: int = 3) -> Dict[str, float]:
+    """
+    Best-of-``repeat`` throughput of a bulk function over ``emails``
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(emails)
+        best = min(best, time.perf_counter() - start)
+    return {'seconds': best, 'addresses_per_sec': len(emails) / best if best > 0 else 0.0}
+
+class FakeResolver:
+    """
+    In-process stand-in for a DNS resolver with a fixed per-query delay
+    """
+    
+    class _Answer:
+        class rrset:
+            ttl = 3600
+    
+    def __init__(self, latency: float = 0.001, missing: Optional[set] = None):
+        self.latency = latency
+        self.missing = missing or set()
+        self.queries = 0
+    
+    def resolve(self, domain: str, rdtype: str):
+        self.queries += 1
+        time.sleep(self.latency)
+        if domain in self.missing:
+            raise dns.resolver.NXDOMAIN()
+        return self._Answer()
+
+def benchmark_dns(emails: List[str], latency: float) -> Dict[str, Dict[str, float]]:
+    """
+    Time MX validation against FakeResolver, cold and warm cache
+    """
+    results = {}
+    
+    resolver = FakeResolver(latency)
+    validator = MXValidator(resolver=resolver)
+    results['validate_email_dns_cold'] = measure_latency(
+        lambda email: validate_email_dns(email, validator), emails
+    )
+    results['validate_email_dns_cold']['queries'] = resolver.queries
+    
+    results['validate_email_dns_warm'] = measure_latency(
+        lambda email: validate_email_dns(email, validator), emails
+    )
+    
+    resolver = FakeResolver(latency)
+    start = time.perf_counter()
+    validate_emails_dns(emails, MXValidator(resolver=resolver))
+    elapsed = time.perf_counter() - start
+    results['validate_emails_dns_cold'] = {
+        'seconds': elapsed,
+        'addresses_per_sec': len(emails) / elapsed if elapsed > 0 else 0.0,
+        'queries': resolver.queries,
+    }
+    return results
+
+def run_benchmarks(size: int = 20000, seed: int = 42, dns_latency: float = 0.001) -> Dict:
+    """
+    Run the full suite and return a JSON-serializable report
+    """
+    corpora = make_corpora(size, seed)
+    report = {'meta': _metadata(size, seed), 'results': {}}
+    results = report['results']
+    
+    for name, emails in corpora.items():
+        results[f"validate_email[{name}]"] = measure_latency(validate_email, emails)
+        results[f"validate_emails[{name}]"] = measure_throughput(validate_emails, emails)
+        results[f"validate_emails_by_domain[{name}]"] = measure_throughput(
+            lambda batch: validate_emails_by_domain(batch, check_dns=False), emails
+        )
+    
+    for name, emails in corpora.items():
+        results[f"validate_email_series[{name}]"] = measure_throughput(validate_email_series, pd.Series(emails))
+    
+    # Keep the DNS corpus small enough that the cold pass stays quick
+    dns_emails = corpora['shared_domains'][:2000] + corpora['valid'][:500]
+    for key, value in benchmark_dns(dns_emails, dns_latency).items():
+        results[f"{key}[shared_domains+valid]"] = value
+    return report
+
+def _metadata(size: int, seed: int) -> Dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'size': size,
+        'seed': seed,
+    }
+
+# --- Differential verification ---
+
+def reference_validate_email(email: str) -> Tuple[bool, Dict[str, str]]:
+    """
+    The original multi-scan validate_email, kept verbatim as the reference
+    that the optimized implementation must agree with
+    """
+    validation_results = {
+        'format_valid': False,
+        'domain_valid': False,
+        'length_valid': False,
+        'special_chars_valid': False,
+        'errors': []
+    }
+    
+    if not email or not isinstance(email, str):
+        validation_results['errors'].append("Email cannot be empty")
+        return False, validation_results
+    
+    if len(email) > 254:
+        validation_results['errors'].append("Email too long (max 254 characters)")
+    elif len(email) < 5:
+        validation_results['errors'].append("Email too short (min 5 characters)")
+    else:
+        validation_results['length_valid'] = True
+    
+    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    if not re.match(email_pattern, email):
+        validation_results['errors'].append("Invalid email format")
+    else:
+        validation_results['format_valid'] = True
+    
+    invalid_chars = ['<', '>', '"', "'", '\\', '|', ';', ':', '/', '*', '?', '=']
+    if any(char in email for char in invalid_chars):
+        validation_results['errors'].append("Email contains invalid characters")
+    else:
+        validation_results['special_chars_valid'] = True
+    
+    if '@' in email:
+        domain = email.split('@')[1]
+        domain_pattern = r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        if re.match(domain_pattern, domain):
+            validation_results['domain_valid'] = True
+        else:
+            validation_results['errors'].append("Invalid domain format")
+    
+    is_valid = all([
+        validation_results['format_valid'],
+        validation_results['domain_valid'],
+        validation_results['length_valid'],
+        validation_results['special_chars_valid']
+    ])
+    
+    return is_valid, validation_results
+
+# Characters the fuzzer draws from, weighted towards the ones the rules care about
+FUZZ_ALPHABET = LOCAL_CHARS + INVALID_CHARS + '@@@...\n\t' + UNICODE_CHARS[:6]
+
+def make_fuzz_corpus(size: int, seed: int = 0) -> List:
+    """
+    Random and mutated addresses plus hand-picked edge cases
+    """
+    rng = random.Random(seed)
+    corpus = ['', None, 0, 42, 'a@b.co', 'a@b.co\n', 'a@b.co\n\n', '@', '@@', 'a@b@c.com',
+              'user@domain.com\n@x', 'x' * 250 + '@a.com', 'user@.com', 'user@domain..com']
+    corpora = make_corpora(max(size // 10, 1), seed)
+    seeds = [email for emails in corpora.values() for email in emails]
+    while len(corpus) < size:
+        if rng.random() < 0.5:
+            email = ''.join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 40)))
+            if rng.random() < 0.5:
+                email += rng.choice(['@gmail.com', '.com', '@x.co.uk', '@a', '\n'])
+        else:
+            email = list(rng.choice(seeds))
+            for _ in range(rng.randint(1, 3)):
+                position = rng.randrange(len(email) + 1)
+                if rng.random() < 0.5 or not email:
+                    email.insert(position, rng.choice(FUZZ_ALPHABET))
+                else:
+                    del email[min(position, len(email) - 1)]
+            email = ''.join(email)
+        corpus.append(email)
+    return corpus
+
+def verify_against_reference(size: int = 200000, seed: int = 0) -> List:
+    """
+    Check validate_email, validate_emails and validate_emails_by_domain
+    against reference_validate_email over a fuzzed corpus
+
+    Returns:
+        List: Addresses on which any implementation disagreed
+    """
+    corpus = make_fuzz_corpus(size, seed)
+    bulk = validate_emails(corpus)
+    planned = validate_emails_by_domain(corpus, check_dns=False).results
+    mismatches = []
+    for i, email in enumerate(corpus):
+        expected = reference_validate_email(email)
+        if (validate_email(email) != expected or bulk.details(i) != expected
+                or planned.details(i) != expected):
+            mismatches.append(email)
+    return mismatches
+
+# --- Regression comparison ---
+
+# Metrics where a larger value is better; every other timing metric is lower-is-better
+HIGHER_IS_BETTER = {'addresses_per_sec'}
+COMPARED_METRICS = {'p50_us', 'p99_us', 'addresses_per_sec'}
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = 0.10) -> List[str]:
+    """
+    List the metrics that regressed by more than ``threshold`` (relative)
+    """
+    regressions = []
+    for name, metrics in current['results'].items():
+        old_metrics = baseline.get('results', {}).get(name)
+        if not old_metrics:
+            continue
+        for metric in COMPARED_METRICS & metrics.keys() & old_metrics.keys():
+            old, new = old_metrics[metric], metrics[metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if metric in HIGHER_IS_BETTER:
+                change = -change
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {old:.2f} -> {new:.2f} ({change:+.1%} worse)")
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark email validation throughput and latency.")
+    parser.add_argument('--size', type=int, default=20000, help="addresses per corpus (default: 20000)")
+    parser.add_argument('--seed', type=int, default=42, help="corpus seed (default: 42)")
+    parser.add_argument('--dns-latency', type=float, default=0.001,
+                        help="simulated DNS query latency in seconds (default: 0.001)")
+    parser.add_argument('-o', '--output', default='email_benchmark.json', help="where to write the JSON report")
+    parser.add_argument('--compare', help="baseline JSON report to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default: 0.10)")
+    parser.add_argument('--verify', type=int, metavar='N',
+                        help="only run the differential check against the reference implementation on N fuzzed addresses")
+    args = parser.parse_args(argv)
+    
+    if args.verify:
+        mismatches = verify_against_reference(args.verify, args.seed)
+        for email in mismatches[:20]:
+            print(f"MISMATCH: {email!r}")
+        print(f"{len(mismatches)} mismatches in {args.verify} fuzzed addresses")
+        return 1 if mismatches else 0
+    
+    report = run_benchmarks(args.size, args.seed, args.dns_latency)
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+    
+    for name, metrics in report['results'].items():
+        summary = ', '.join(f"{metric}={value:.2f}" for metric, value in metrics.items())
+        print(f"{name:<50} {summary}")
+    print(f"\nReport written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            baseline = json.load(handle)
+        regressions = compare_reports(baseline, report, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,34 @@
 import requests
 import json
 import base64
+import os
+import asyncio
+import csv
+import hashlib
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator
+from requests.adapters import HTTPAdapter
+
+# Base URL of the Generative Language API; point it at a local mock server for testing
+API_BASE_URL = os.environ.get("GENERATIVE_LANGUAGE_API_URL", "https://generativelanguage.googleapis.com/v1beta")
+
+NARRATIVE_MODEL = "gemini-2.0-flash"
+IMAGE_MODEL = "imagen-3.0-generate-002"
+# Bump whenever the narrative prompt or schema changes, so cached stories are not reused
+PROMPT_TEMPLATE_VERSION = 1
+
+# Default number of scene images generated at the same time
+MAX_CONCURRENT_IMAGES = 3
+
+# HTTP client settings: seconds to establish a connection / to wait for a response
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 120.0
+# Kept-alive connections per host; at least MAX_CONCURRENT_IMAGES + 1 so none are dropped
+POOL_MAXSIZE = 16
 
 # --- Helper Functions (Corresponding to Client-Side Logic) ---
 
@@ -26,33 +54,74 @@ def _validate_inputs(movie_title: str, what_if_scenario: str) -> tuple[bool, str
     return True, ""
 
 
+# --- HTTP Client ---
+
+_session = None
+_session_lock = threading.Lock()
+
+def create_session(pool_maxsize: int = POOL_MAXSIZE) -> requests.Session:
+    """
+    Creates a requests.Session with a connection pool sized for concurrent calls.
+
+    Connections are kept alive and reused, so only the first request to a host
+    pays the TCP and TLS handshake.
+
+    Args:
+        pool_maxsize (int): Connections kept open per host.
+
+    Returns:
+        requests.Session: A session with JSON headers and pooled HTTP/HTTPS adapters.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({'Content-Type': 'application/json'})
+    return session
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared session used by default for all API calls, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+def _post_json(url: str, payload: dict, session: requests.Session = None) -> requests.Response:
+    """
+    POSTs a JSON payload over the pooled session with connect/read timeouts.
+
+    Args:
+        url (str): The endpoint URL.
+        payload (dict): The JSON body.
+        session (requests.Session): Session to use; defaults to the shared session.
+
+    Returns:
+        requests.Response: The response, after raise_for_status().
+
+    Raises:
+        requests.exceptions.RequestException: On connection errors, timeouts or HTTP errors.
+    """
+    session = session or get_session()
+    response = session.post(url, json=payload, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+    response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
+    return response
+
+
 # --- AI API Interaction Functions ---
 
-def _generate_narrative(movie_title: str, what_if_scenario: str, api_key: str) -> dict:
+def _narrative_payload(movie_title: str, what_if_scenario: str) -> dict:
     """
-    Generates a creative "what if" story and identifies key scenes using the gemini-2.0-flash AI model.
+    Builds the generateContent request body for a "what if" story.
 
     Args:
         movie_title (str): The title of the movie.
         what_if_scenario (str): The "what if" scenario for the story.
-        api_key (str): Your Google Cloud API key for accessing the Gemini API.
 
     Returns:
-        dict: A dictionary containing the generated story's title, narrative, and scene descriptions.
-              Example:
-              {
-                  "title": "New Story Title",
-                  "narrative": "The full story text...",
-                  "scenes": [
-                      {"description": "Description for scene 1"},
-                      {"description": "Description for scene 2"},
-                      {"description": "Description for scene 3"}
-                  ]
-              }
-
-    Raises:
-        Exception: If the API call fails, returns an unexpected status, or the JSON
-                   response is malformed or missing expected data.
+        dict: The request payload, asking for a JSON object with title, narrative and scenes.
     """
     narrative_prompt = f"""Generate a creative "what if" story for the movie "{movie_title}" based on the scenario: "{what_if_scenario}". The story should be between 150-300 words.
     Also, identify 2-3 key scenes from this new narrative that would be visually striking. For each scene, provide a brief, vivid description (max 20 words) suitable for image generation.
@@ -93,12 +162,54 @@ def _generate_narrative(movie_title: str, what_if_scenario: str, api_key: str) -
             }
         }
     }
+    return payload
+
+def _check_story(parsed_result: dict) -> dict:
+    """
+    Basic validation of the parsed narrative structure.
+
+    Raises:
+        Exception: If title, narrative or scenes are missing, or scenes is not a list.
+    """
+    if not all(k in parsed_result for k in ["title", "narrative", "scenes"]):
+        raise Exception("Parsed JSON from narrative generation is missing required fields (title, narrative, or scenes).")
+    if not isinstance(parsed_result["scenes"], list):
+        raise Exception("Scenes field from narrative generation is not a list.")
+    return parsed_result
+
+def _generate_narrative(movie_title: str, what_if_scenario: str, api_key: str,
+                        session: requests.Session = None) -> dict:
+    """
+    Generates a creative "what if" story and identifies key scenes using the gemini-2.0-flash AI model.
+
+    Args:
+        movie_title (str): The title of the movie.
+        what_if_scenario (str): The "what if" scenario for the story.
+        api_key (str): Your Google Cloud API key for accessing the Gemini API.
+        session (requests.Session): HTTP session to use; defaults to the shared pooled session.
+
+    Returns:
+        dict: A dictionary containing the generated story's title, narrative, and scene descriptions.
+              Example:
+              {
+                  "title": "New Story Title",
+                  "narrative": "The full story text...",
+                  "scenes": [
+                      {"description": "Description for scene 1"},
+                      {"description": "Description for scene 2"},
+                      {"description": "Description for scene 3"}
+                  ]
+              }
 
-    api_url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
+    Raises:
+        Exception: If the API call fails, returns an unexpected status, or the JSON
+                   response is malformed or missing expected data.
+    """
+    payload = _narrative_payload(movie_title, what_if_scenario)
+    api_url = f"{API_BASE_URL}/models/{NARRATIVE_MODEL}:generateContent?key={api_key}"
 
     try:
-        response = requests.post(api_url, headers={'Content-Type': 'application/json'}, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
+        response = _post_json(api_url, payload, session)
 
         # The API returns the JSON as a string within the 'text' part
         result = response.json()
@@ -110,12 +221,7 @@ def _generate_narrative(movie_title: str, what_if_scenario: str, api_key: str) -
         parsed_result = json.loads(json_string)
 
         # Basic validation of the parsed structure
-        if not all(k in parsed_result for k in ["title", "narrative", "scenes"]):
-            raise Exception("Parsed JSON from narrative generation is missing required fields (title, narrative, or scenes).")
-        if not isinstance(parsed_result["scenes"], list):
-            raise Exception("Scenes field from narrative generation is not a list.")
-
-        return parsed_result
+        return _check_story(parsed_result)
 
     except requests.exceptions.RequestException as e:
         raise Exception(f"API request for narrative generation failed: {e}")
@@ -124,13 +230,155 @@ def _generate_narrative(movie_title: str, what_if_scenario: str, api_key: str) -
     except Exception as e:
         raise Exception(f"An error occurred during narrative generation: {e}")
 
-def _generate_image(scene_description: str, api_key: str) -> str:
+class StoryStreamParser:
+    """
+    Incremental parser for the story JSON while it is still streaming in.
+
+    Feed it text fragments in order; each feed() returns the events that became
+    available: ("title", str) once the title string is complete, ("narrative", str)
+    for every newly decoded piece of the narrative, and ("scene", dict) as soon as
+    a scene object is closed. Only the structure of the response schema is tracked,
+    so the full text is still parsed with json.loads at the end.
+    """
+
+    def __init__(self):
+        self._stack = []         # open containers, '{' or '['
+        self._keys = []          # current key of each open object (None for arrays)
+        self._expect_key = False
+        self._in_string = False
+        self._escape = False
+        self._is_key = False
+        self._raw = []           # raw characters of the current string
+        self._emitted = 0        # narrative characters already emitted
+        self._scene = None
+
+    def _in_narrative(self) -> bool:
+        return self._in_string and not self._is_key and self._stack == ['{'] and self._keys[0] == "narrative"
+
+    def _in_scene(self) -> bool:
+        return self._stack == ['{', '[', '{'] and self._keys[0] == "scenes"
+
+    def _string_end(self, value: str, events: list) -> None:
+        if self._is_key:
+            self._keys[-1] = value
+        elif self._stack == ['{'] and self._keys[0] == "title":
+            events.append(("title", value))
+        elif self._stack == ['{'] and self._keys[0] == "narrative":
+            if len(value) > self._emitted:
+                events.append(("narrative", value[self._emitted:]))
+        elif self._in_scene() and self._scene is not None:
+            self._scene[self._keys[-1]] = value
+
+    def _partial_narrative(self, events: list) -> None:
+        raw = "".join(self._raw)
+        # Drop a trailing escape sequence that is not complete yet (at most "\uXXX")
+        for cut in range(min(6, len(raw)) + 1):
+            try:
+                decoded = json.loads('"' + raw[:len(raw) - cut] + '"')
+                break
+            except json.JSONDecodeError:
+                continue
+        else:
+            return
+        if decoded and "\ud800" <= decoded[-1] <= "\udbff":
+            decoded = decoded[:-1]  # first half of an escaped surrogate pair
+        if len(decoded) > self._emitted:
+            events.append(("narrative", decoded[self._emitted:]))
+            self._emitted = len(decoded)
+
+    def feed(self, fragment: str) -> list:
+        """
+        Consumes the next fragment of the response text.
+
+        Returns:
+            list: (kind, value) events completed by this fragment.
+        """
+        events = []
+        for c in fragment:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._string_end(json.loads('"' + "".join(self._raw) + '"'), events)
+                    continue
+                self._raw.append(c)
+            elif c == '"':
+                self._in_string = True
+                self._is_key = bool(self._stack) and self._stack[-1] == '{' and self._expect_key
+                self._raw = []
+            elif c == '{':
+                if self._stack == ['{', '['] and self._keys[0] == "scenes":
+                    self._scene = {}
+                self._stack.append(c)
+                self._keys.append(None)
+                self._expect_key = True
+            elif c == '[':
+                self._stack.append(c)
+                self._keys.append(None)
+            elif c in '}]':
+                if c == '}' and self._in_scene() and self._scene is not None:
+                    events.append(("scene", self._scene))
+                    self._scene = None
+                self._stack.pop()
+                self._keys.pop()
+            elif c == ':':
+                self._expect_key = False
+            elif c == ',':
+                self._expect_key = bool(self._stack) and self._stack[-1] == '{'
+        if self._in_narrative():
+            self._partial_narrative(events)
+        return events
+
+def _stream_narrative(movie_title: str, what_if_scenario: str, api_key: str,
+                      session: requests.Session = None) -> Iterator[str]:
+    """
+    Streams the story JSON text from the streamGenerateContent endpoint (server-sent events).
+
+    Args:
+        movie_title (str): The title of the movie.
+        what_if_scenario (str): The "what if" scenario for the story.
+        api_key (str): Your Google Cloud API key for accessing the Gemini API.
+        session (requests.Session): HTTP session to use; defaults to the shared pooled session.
+
+    Yields:
+        str: Consecutive fragments of the response text, as they arrive.
+
+    Raises:
+        Exception: If the API call fails or a streamed chunk is malformed.
+    """
+    payload = _narrative_payload(movie_title, what_if_scenario)
+    api_url = f"{API_BASE_URL}/models/{NARRATIVE_MODEL}:streamGenerateContent?alt=sse&key={api_key}"
+    session = session or get_session()
+
+    try:
+        with session.post(api_url, json=payload, stream=True, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)) as response:
+            response.raise_for_status()
+            response.encoding = "utf-8"  # event streams carry no charset; requests would assume latin-1
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                chunk = json.loads(line[len("data:"):])
+                for candidate in chunk.get("candidates", [])[:1]:
+                    for part in candidate.get("content", {}).get("parts", []):
+                        if part.get("text"):
+                            yield part["text"]
+
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"API request for narrative streaming failed: {e}")
+    except json.JSONDecodeError as e:
+        raise Exception(f"Failed to decode streamed chunk from narrative API: {e}")
+
+def _generate_image(scene_description: str, api_key: str, session: requests.Session = None) -> str:
     """
     Generates a base64 encoded image for a given scene description using the imagen-3.0-generate-002 model.
 
     Args:
         scene_description (str): The descriptive text for the image to be generated.
         api_key (str): Your Google Cloud API key for accessing the Imagen API.
+        session (requests.Session): HTTP session to use; defaults to the shared pooled session.
 
     Returns:
         str: A base64 encoded string of the generated image.
@@ -139,11 +387,10 @@ def _generate_image(scene_description: str, api_key: str) -> str:
         Exception: If the image API call fails or returns an unexpected response.
     """
     image_payload = { "instances": { "prompt": scene_description }, "parameters": { "sampleCount": 1} }
-    image_api_url = f"https://generativelanguage.googleapis.com/v1beta/models/imagen-3.0-generate-002:predict?key={api_key}"
+    image_api_url = f"{API_BASE_URL}/models/{IMAGE_MODEL}:predict?key={api_key}"
 
     try:
-        image_response = requests.post(image_api_url, headers={'Content-Type': 'application/json'}, json=image_payload)
-        image_response.raise_for_status() # Raise an exception for HTTP errors
+        image_response = _post_json(image_api_url, image_payload, session)
 
         image_result = image_response.json()
 
@@ -157,9 +404,280 @@ def _generate_image(scene_description: str, api_key: str) -> str:
     except Exception as e:
         raise Exception(f"An error occurred during image generation: {e}")
 
+# --- Generation Cache ---
+
+# Cache settings; WHAT_IF_CACHE_DIR enables the on-disk tier of the shared cache
+CACHE_MEMORY_BYTES = 64 * 1024 * 1024
+CACHE_DISK_BYTES = 1024 * 1024 * 1024
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+def _normalize(text: str) -> str:
+    """
+    Normalizes free text for cache keys: case-folded, with whitespace collapsed.
+    """
+    return " ".join(text.split()).casefold()
+
+def narrative_cache_key(movie_title: str, what_if_scenario: str, model: str = NARRATIVE_MODEL,
+                        template_version: int = PROMPT_TEMPLATE_VERSION) -> str:
+    """
+    Content address of a narrative: SHA-256 of the normalized inputs, model and prompt version.
+    """
+    parts = ["narrative", model, template_version, _normalize(movie_title), _normalize(what_if_scenario)]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+def image_cache_key(scene_description: str, model: str = IMAGE_MODEL) -> str:
+    """
+    Content address of a scene image: SHA-256 of the normalized description and model.
+    """
+    parts = ["image", model, _normalize(scene_description)]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+class GenerationCache:
+    """
+    Two-tier cache of generated content, keyed by content address.
+
+    Values are raw bytes: narratives as UTF-8 JSON, images as the decoded image
+    bytes (about 25% smaller than base64). The memory tier is an LRU bounded by
+    total size. The optional disk tier keeps one file per key under directory,
+    expires entries after ttl seconds (by file modification time) and evicts the
+    least recently used files once max_disk_bytes is exceeded. Disk hits are
+    promoted to memory. Safe to share between threads.
+    """
+
+    def __init__(self, directory: str = None, max_memory_bytes: int = CACHE_MEMORY_BYTES,
+                 max_disk_bytes: int = CACHE_DISK_BYTES, ttl: float = CACHE_TTL_SECONDS):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (expires_at, data)
+        self._memory_bytes = 0
+        self._disk = OrderedDict()    # key -> file size, least recently used first
+        self._disk_bytes = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load_disk_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def _load_disk_index(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".bin"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+    def _remember(self, key: str, data: bytes, expires_at: float) -> None:
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key)[1])
+        if len(data) > self.max_memory_bytes:
+            return
+        self._memory[key] = (expires_at, data)
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _forget_disk(self, key: str) -> str:
+        """
+        Drops key from the disk index (caller holds the lock) and returns its path.
+        """
+        self._disk_bytes -= self._disk.pop(key, 0)
+        return self._path(key)
+
+    @staticmethod
+    def _remove_files(paths) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _read_disk(self, key: str, now: float):
+        """
+        Returns (expires_at, data) for an unexpired file, or None. Runs without the lock.
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                expires_at = os.fstat(f.fileno()).st_mtime + self.ttl
+                if expires_at <= now:
+                    return None
+                return expires_at, f.read()
+        except FileNotFoundError:
+            return None
+
+    def get(self, key: str) -> bytes:
+        """
+        Returns the cached bytes for key, or None if missing or expired.
+        """
+        # The lock guards only the in-memory indexes; file I/O happens outside
+        # it, so a slow disk read never blocks memory hits on other threads.
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self._memory_bytes -= len(self._memory.pop(key)[1])
+            on_disk = self.directory and key in self._disk
+            if not on_disk:
+                self.misses += 1
+                return None
+
+        found = self._read_disk(key, now)
+        with self._lock:
+            if found is not None:
+                if key in self._disk:
+                    self._disk.move_to_end(key)
+                self._remember(key, found[1], found[0])
+                self.hits += 1
+                return found[1]
+            self.misses += 1
+            stale = self._forget_disk(key) if key in self._disk else None
+        if stale:
+            self._remove_files([stale])
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Stores bytes under key in both tiers.
+        """
+        with self._lock:
+            self._remember(key, data, time.time() + self.ttl)
+        if not self.directory or len(data) > self.max_disk_bytes:
+            return
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))
+        with self._lock:
+            self._disk_bytes -= self._disk.pop(key, 0)
+            self._disk[key] = len(data)
+            self._disk_bytes += len(data)
+            evicted = []
+            while self._disk_bytes > self.max_disk_bytes:
+                evicted.append(self._forget_disk(next(iter(self._disk))))
+        self._remove_files(evicted)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from both tiers.
+        """
+        with self._lock:
+            paths = [self._forget_disk(key) for key in list(self._disk)]
+            self._memory.clear()
+            self._memory_bytes = 0
+        self._remove_files(paths)
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> GenerationCache:
+    """
+    Returns the shared cache, creating it on first use (disk tier in WHAT_IF_CACHE_DIR, if set).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GenerationCache(os.environ.get("WHAT_IF_CACHE_DIR"))
+        return _cache
+
+def _cached_narrative(movie_title: str, what_if_scenario: str, api_key: str,
+                      session: requests.Session = None, cache: GenerationCache = None) -> dict:
+    """
+    _generate_narrative, served from the cache when the same normalized prompt was generated before.
+    """
+    key = narrative_cache_key(movie_title, what_if_scenario)
+    data = cache.get(key)
+    if data is not None:
+        return json.loads(data)
+    story_data = _generate_narrative(movie_title, what_if_scenario, api_key, session)
+    cache.put(key, json.dumps(story_data).encode())
+    return story_data
+
+def _cached_image(scene_description: str, api_key: str, session: requests.Session = None,
+                  cache: GenerationCache = None) -> str:
+    """
+    _generate_image, served from the cache (stored as raw bytes, returned as base64).
+    """
+    key = image_cache_key(scene_description)
+    data = cache.get(key)
+    if data is not None:
+        return base64.b64encode(data).decode("ascii")
+    image_base64 = _generate_image(scene_description, api_key, session)
+    cache.put(key, base64.b64decode(image_base64))
+    return image_base64
+
+
 # --- Main Orchestration Function ---
 
-def generate_what_if_story_full(movie_title: str, what_if_scenario: str, api_key: str) -> dict:
+def _generate_scene(scene: dict, api_key: str, session: requests.Session = None,
+                    cache: GenerationCache = None) -> dict:
+    """
+    Generates the image for one scene, turning a failure into a per-scene error entry.
+
+    Args:
+        scene (dict): A scene from the narrative, with a "description" key.
+        api_key (str): Your Google Cloud API key for accessing the Imagen API.
+        session (requests.Session): HTTP session to use; defaults to the shared pooled session.
+        cache (GenerationCache): Cache to serve the image from; None to always generate.
+
+    Returns:
+        dict: The scene with "image_base64" set, or with "image_base64": None and an "error".
+    """
+    try:
+        if cache is not None:
+            image_base64 = _cached_image(scene["description"], api_key, session, cache)
+        else:
+            image_base64 = _generate_image(scene["description"], api_key, session)
+        return {
+            "description": scene["description"],
+            "image_base64": image_base64
+        }
+    except Exception as e:
+        # Log image generation errors but don't stop the whole process
+        print(f"Warning: Could not generate image for scene '{scene['description']}': {e}")
+        return {
+            "description": scene["description"],
+            "image_base64": None, # Indicate failure for this image
+            "error": str(e)
+        }
+
+def _generate_scenes(scenes: list, api_key: str, max_concurrent_images: int = MAX_CONCURRENT_IMAGES,
+                     session: requests.Session = None, cache: GenerationCache = None) -> list:
+    """
+    Generates the images for all scenes concurrently, at most max_concurrent_images at a time.
+
+    Args:
+        scenes (list): Scenes from the narrative.
+        api_key (str): Your Google Cloud API key for accessing the Imagen API.
+        max_concurrent_images (int): Upper bound on simultaneous image requests.
+        session (requests.Session): HTTP session to use; defaults to the shared pooled session.
+        cache (GenerationCache): Cache to serve images from; None to always generate.
+
+    Returns:
+        list: The scenes with image data, in the original order.
+    """
+    if not scenes:
+        return []
+    session = session or get_session()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent_images, len(scenes)))) as pool:
+        return list(pool.map(lambda scene: _generate_scene(scene, api_key, session, cache), scenes))
+
+def generate_what_if_story_full(movie_title: str, what_if_scenario: str, api_key: str,
+                                max_concurrent_images: int = MAX_CONCURRENT_IMAGES,
+                                session: requests.Session = None, use_cache: bool = True,
+                                cache: GenerationCache = None) -> dict:
     """
     Orchestrates the full "What If" story generation process, including input validation,
     narrative generation, and image generation for key scenes.
@@ -168,6 +686,11 @@ def generate_what_if_story_full(movie_title: str, what_if_scenario: str, api_key
         movie_title (str): The title of the movie.
         what_if_scenario (str): The "what if" scenario for the story.
         api_key (str): Your Google Cloud API key for accessing the AI APIs.
+        max_concurrent_images (int): How many scene images are generated at the same time.
+                                     Total latency is roughly narrative time plus the slowest image.
+        session (requests.Session): HTTP session for all calls; defaults to the shared pooled session.
+        use_cache (bool): Reuse narratives and images generated before for the same normalized inputs.
+        cache (GenerationCache): Cache to use; defaults to the shared cache (see get_cache).
 
     Returns:
         dict: A dictionary containing the full story details and base64 encoded images.
@@ -197,25 +720,15 @@ def generate_what_if_story_full(movie_title: str, what_if_scenario: str, api_key
 
     try:
         # 2. AI-Driven Narrative Generation
-        story_data = _generate_narrative(movie_title, what_if_scenario, api_key)
+        session = session or get_session()
+        cache = (cache or get_cache()) if use_cache else None
+        if cache is not None:
+            story_data = _cached_narrative(movie_title, what_if_scenario, api_key, session, cache)
+        else:
+            story_data = _generate_narrative(movie_title, what_if_scenario, api_key, session)
         
-        # 3. AI-Generated Key Scene Visuals
-        scenes_with_images = []
-        for scene in story_data.get("scenes", []):
-            try:
-                image_base64 = _generate_image(scene["description"], api_key)
-                scenes_with_images.append({
-                    "description": scene["description"],
-                    "image_base64": image_base64
-                })
-            except Exception as e:
-                # Log image generation errors but don't stop the whole process
-                print(f"Warning: Could not generate image for scene '{scene['description']}': {e}")
-                scenes_with_images.append({
-                    "description": scene["description"],
-                    "image_base64": None, # Indicate failure for this image
-                    "error": str(e)
-                })
+        # 3. AI-Generated Key Scene Visuals (concurrently, in scene order)
+        scenes_with_images = _generate_scenes(story_data.get("scenes", []), api_key, max_concurrent_images, session, cache)
 
         story_data["scenes"] = scenes_with_images # Update scenes with image data
 
@@ -229,6 +742,359 @@ def generate_what_if_story_full(movie_title: str, what_if_scenario: str, api_key
         return {"success": False, "message": f"An error occurred during story generation: {e}"}
 
 
+def generate_what_if_story_stream(movie_title: str, what_if_scenario: str, api_key: str,
+                                  max_concurrent_images: int = MAX_CONCURRENT_IMAGES,
+                                  session: requests.Session = None, use_cache: bool = True,
+                                  cache: GenerationCache = None) -> Iterator[dict]:
+    """
+    Streaming variant of generate_what_if_story_full that yields events as results arrive.
+
+    The narrative is read from the streaming endpoint; each scene's image job starts
+    as soon as its description is complete, while the rest of the story is still
+    streaming. Events, in arrival order:
+        {"type": "title", "title": "..."}
+        {"type": "narrative", "text": "..."}               (successive pieces of the narrative)
+        {"type": "scene", "index": 0, "description": "..."}
+        {"type": "image", "index": 0, "description": "...", "image_base64": "..."}
+                                                            (or "image_base64": None and "error")
+        {"type": "done", "result": {...}}                   (always last; same dict as generate_what_if_story_full)
+
+    Args:
+        movie_title (str): The title of the movie.
+        what_if_scenario (str): The "what if" scenario for the story.
+        api_key (str): Your Google Cloud API key for accessing the AI APIs.
+        max_concurrent_images (int): How many scene images are generated at the same time.
+        session (requests.Session): HTTP session for all calls; defaults to the shared pooled session.
+        use_cache (bool): Reuse narratives and images generated before for the same normalized inputs.
+        cache (GenerationCache): Cache to use; defaults to the shared cache (see get_cache).
+
+    Yields:
+        dict: Story events.
+    """
+    # 1. Input Validation
+    is_valid, error_message = _validate_inputs(movie_title, what_if_scenario)
+    if not is_valid:
+        yield {"type": "done", "result": {"success": False, "message": error_message}}
+        return
+
+    session = session or get_session()
+    cache = (cache or get_cache()) if use_cache else None
+    pool = ThreadPoolExecutor(max_workers=max(1, max_concurrent_images))
+    scenes = []
+    pending = {}  # image future -> scene index
+
+    def start_scene(scene: dict) -> dict:
+        index = len(scenes)
+        scenes.append(None)
+        pending[pool.submit(_generate_scene, {"description": scene.get("description", "")},
+                            api_key, session, cache)] = index
+        return {"type": "scene", "index": index, "description": scene.get("description", "")}
+
+    def image_events(wait: bool) -> Iterator[dict]:
+        ready = as_completed(list(pending)) if wait else [f for f in list(pending) if f.done()]
+        for future in ready:
+            index = pending.pop(future)
+            scenes[index] = future.result()
+            yield {"type": "image", "index": index, **scenes[index]}
+
+    try:
+        # 2. AI-Driven Narrative Generation, streamed; scene images start as scenes complete
+        key = narrative_cache_key(movie_title, what_if_scenario)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            story_data = json.loads(cached)
+            yield {"type": "title", "title": story_data["title"]}
+            yield {"type": "narrative", "text": story_data["narrative"]}
+            for scene in story_data["scenes"]:
+                yield start_scene(scene)
+        else:
+            parser = StoryStreamParser()
+            text = []
+            for fragment in _stream_narrative(movie_title, what_if_scenario, api_key, session):
+                text.append(fragment)
+                for kind, value in parser.feed(fragment):
+                    if kind == "title":
+                        yield {"type": "title", "title": value}
+                    elif kind == "narrative":
+                        yield {"type": "narrative", "text": value}
+                    else:
+                        yield start_scene(value)
+                yield from image_events(wait=False)
+
+            try:
+                story_data = _check_story(json.loads("".join(text)))
+            except json.JSONDecodeError as e:
+                raise Exception(f"Failed to decode JSON response from narrative API: {e}")
+            for scene in story_data["scenes"][len(scenes):]:
+                yield start_scene(scene)
+            if cache is not None:
+                cache.put(key, json.dumps(story_data).encode())
+
+        # 3. AI-Generated Key Scene Visuals (remaining ones)
+        yield from image_events(wait=True)
+        story_data["scenes"] = scenes
+
+        yield {"type": "done", "result": {
+            "success": True,
+            "message": "Story and scenes generated successfully.",
+            "data": story_data
+        }}
+
+    except Exception as e:
+        yield {"type": "done", "result": {"success": False, "message": f"An error occurred during story generation: {e}"}}
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Batch Generation ---
+
+# Default per-endpoint limits for batch runs: requests in flight, and requests per second (None = unlimited)
+BATCH_NARRATIVE_CONCURRENCY = 8
+BATCH_IMAGE_CONCURRENCY = 16
+BATCH_NARRATIVE_RATE = None
+BATCH_IMAGE_RATE = None
+# Requests a limiter may send back to back before the rate applies
+BATCH_BURST = 1
+# Stories started but not yet written to the sink
+BATCH_MAX_PENDING = 64
+
+class TokenBucket:
+    """
+    Client-side token bucket: on average rate acquisitions per second, with bursts up to capacity.
+
+    The bucket starts full, so at most capacity requests go out back to back.
+    """
+
+    def __init__(self, rate: float, capacity: float = BATCH_BURST):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Waits until a token is available and takes it.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+class EndpointLimiter:
+    """
+    Bounds the requests in flight to one endpoint and, optionally, their rate.
+
+    Use as an async context manager around each request.
+    """
+
+    def __init__(self, concurrency: int, rate: float = None, burst: float = BATCH_BURST):
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._bucket = TokenBucket(rate, burst) if rate else None
+
+    async def __aenter__(self) -> "EndpointLimiter":
+        await self._semaphore.acquire()
+        if self._bucket is not None:
+            try:
+                await self._bucket.acquire()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+def read_story_requests(csv_path: str) -> Iterator[tuple]:
+    """
+    Reads (index, movie_title, what_if_scenario) rows lazily from a CSV with those two columns.
+
+    Args:
+        csv_path (str): CSV file with a header row containing movie_title and what_if_scenario.
+
+    Yields:
+        tuple: (row index starting at 0, movie title, scenario).
+    """
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for index, row in enumerate(csv.DictReader(f)):
+            yield index, row.get("movie_title") or "", row.get("what_if_scenario") or ""
+
+def _completed_indices(sink_path: str) -> set:
+    """
+    Indices already written to a JSONL sink; a partial last line from an interrupted run is cut off.
+    """
+    if not os.path.exists(sink_path):
+        return set()
+    indices = set()
+    end = 0
+    with open(sink_path, "rb+") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            if line.strip():
+                indices.add(json.loads(line)["index"])
+        f.truncate(end)
+    return indices
+
+async def _generate_story_async(movie_title: str, what_if_scenario: str, api_key: str, run) -> dict:
+    """
+    generate_what_if_story_full for the batch runner: each request waits for its endpoint limiter.
+    """
+    is_valid, error_message = _validate_inputs(movie_title, what_if_scenario)
+    if not is_valid:
+        return {"success": False, "message": error_message}
+
+    try:
+        async with run.narrative_limiter:
+            if run.cache is not None:
+                story_data = await run.call(_cached_narrative, movie_title, what_if_scenario, api_key,
+                                            run.session, run.cache)
+            else:
+                story_data = await run.call(_generate_narrative, movie_title, what_if_scenario, api_key, run.session)
+
+        async def scene_with_image(scene: dict) -> dict:
+            async with run.image_limiter:
+                return await run.call(_generate_scene, scene, api_key, run.session, run.cache)
+
+        story_data["scenes"] = list(await asyncio.gather(*(scene_with_image(scene) for scene in story_data.get("scenes", []))))
+
+        return {
+            "success": True,
+            "message": "Story and scenes generated successfully.",
+            "data": story_data
+        }
+
+    except Exception as e:
+        return {"success": False, "message": f"An error occurred during story generation: {e}"}
+
+class _BatchRun:
+    """
+    Shared state of one batch run: limiters, HTTP session, cache and the worker threads.
+    """
+
+    def __init__(self, narrative_concurrency, image_concurrency, narrative_rate, image_rate,
+                 narrative_burst, image_burst, session, cache):
+        self.narrative_limiter = EndpointLimiter(narrative_concurrency, narrative_rate, narrative_burst)
+        self.image_limiter = EndpointLimiter(image_concurrency, image_rate, image_burst)
+        self.session = session or create_session(pool_maxsize=narrative_concurrency + image_concurrency)
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=narrative_concurrency + image_concurrency)
+
+    async def call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+async def generate_story_batch_async(stories, sink_path: str, api_key: str, ordered: bool = False,
+                                     max_pending: int = BATCH_MAX_PENDING,
+                                     narrative_concurrency: int = BATCH_NARRATIVE_CONCURRENCY,
+                                     image_concurrency: int = BATCH_IMAGE_CONCURRENCY,
+                                     narrative_rate: float = BATCH_NARRATIVE_RATE,
+                                     image_rate: float = BATCH_IMAGE_RATE,
+                                     narrative_burst: float = BATCH_BURST,
+                                     image_burst: float = BATCH_BURST,
+                                     session: requests.Session = None, use_cache: bool = True,
+                                     cache: GenerationCache = None) -> dict:
+    """
+    Generates many stories concurrently, appending one JSON line per story to sink_path.
+
+    Requests to each endpoint are capped in number (concurrency) and optionally in rate
+    (token bucket, requests per second), so a run stays within quota. Input is consumed
+    lazily and at most max_pending stories are in progress or waiting to be written, so
+    memory stays bounded for any input size. Stories already in the sink (matched by index)
+    are skipped, so an interrupted run resumes where it stopped.
+
+    Args:
+        stories: Iterable of (index, movie_title, what_if_scenario), e.g. read_story_requests(path).
+        sink_path (str): JSONL output; each line is {"index", "movie_title", "what_if_scenario"}
+                         plus the dict generate_what_if_story_full returns.
+        api_key (str): Your Google Cloud API key for accessing the AI APIs.
+        ordered (bool): Write lines in input order instead of as stories complete.
+        max_pending (int): Stories in progress or buffered at once (backpressure on the input).
+        narrative_concurrency (int): Narrative requests in flight at once.
+        image_concurrency (int): Image requests in flight at once.
+        narrative_rate (float): Narrative requests per second, or None for no limit.
+        image_rate (float): Image requests per second, or None for no limit.
+        narrative_burst (float): Narrative requests that may go out back to back under narrative_rate.
+        image_burst (float): Image requests that may go out back to back under image_rate.
+        session (requests.Session): HTTP session; defaults to a new pooled session sized for the run.
+        use_cache (bool): Reuse narratives and images generated before for the same normalized inputs.
+        cache (GenerationCache): Cache to use; defaults to the shared cache (see get_cache).
+
+    Returns:
+        dict: Counts of "written", "succeeded", "failed" and "skipped" stories, and "seconds".
+    """
+    started = time.perf_counter()
+    done = _completed_indices(sink_path)
+    run = _BatchRun(narrative_concurrency, image_concurrency, narrative_rate, image_rate,
+                    narrative_burst, image_burst, session,
+                    (cache or get_cache()) if use_cache else None)
+    stats = {"written": 0, "succeeded": 0, "failed": 0, "skipped": 0}
+    window = asyncio.Semaphore(max_pending)
+    finished = {}  # ordered mode: completed records waiting for earlier ones
+    order = []     # ordered mode: indices in input order, not yet written
+
+    with open(sink_path, "a", encoding="utf-8") as sink:
+        def write(record: dict) -> None:
+            sink.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sink.flush()
+            stats["written"] += 1
+            stats["succeeded" if record["success"] else "failed"] += 1
+            window.release()
+
+        async def process(index: int, movie_title: str, what_if_scenario: str) -> None:
+            result = await _generate_story_async(movie_title, what_if_scenario, api_key, run)
+            record = {"index": index, "movie_title": movie_title, "what_if_scenario": what_if_scenario, **result}
+            if not ordered:
+                write(record)
+                return
+            finished[index] = record
+            while order and order[0] in finished:
+                write(finished.pop(order.pop(0)))
+
+        tasks = set()
+        try:
+            for index, movie_title, what_if_scenario in stories:
+                if index in done:
+                    stats["skipped"] += 1
+                    continue
+                await window.acquire()  # backpressure: wait for a slot before reading on
+                order.append(index)
+                task = asyncio.create_task(process(index, movie_title, what_if_scenario))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            run.executor.shutdown(wait=False, cancel_futures=True)
+
+    stats["seconds"] = time.perf_counter() - started
+    return stats
+
+def generate_story_batch(csv_path: str, sink_path: str, api_key: str, **options) -> dict:
+    """
+    Runs generate_story_batch_async over a CSV of (movie_title, what_if_scenario) rows.
+
+    Args:
+        csv_path (str): Input CSV with movie_title and what_if_scenario columns.
+        sink_path (str): JSONL output, appended to; rerun with the same paths to resume.
+        api_key (str): Your Google Cloud API key for accessing the AI APIs.
+        **options: Passed to generate_story_batch_async (ordered, max_pending, limits, ...).
+
+    Returns:
+        dict: Run statistics, see generate_story_batch_async.
+    """
+    return asyncio.run(generate_story_batch_async(read_story_requests(csv_path), sink_path, api_key, **options))
+
+
 # Example Usage (replace "YOUR_API_KEY" with your actual key)
 if __name__ == "__main__":
     # You would typically load the API key from environment variables in a real application
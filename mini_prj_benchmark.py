@@ -0,0 +1,414 @@
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+import mini_prj
+
+# Small stand-in for a generated PNG
+FAKE_IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64
+
+class MockGenerativeLanguageAPI:
+    """
+    Local stand-in for the generativelanguage endpoints used by mini_prj
+
+    Serves generateContent and streamGenerateContent (narrative, the latter as
+    server-sent events spread over the same latency) and predict (image) with
+    configurable latencies over HTTP/1.1 keep-alive. Scene descriptions containing "FAIL"
+    get an HTTP 500 from the image endpoint. The server counts requests, TCP
+    connections and the peak number of concurrent image requests.
+    """
+
+    def __init__(self, narrative_latency: float = 0.2, image_latency: float = 0.5, scenes: int = 3):
+        self.narrative_latency = narrative_latency
+        self.image_latency = image_latency
+        self.scenes = scenes
+        self.lock = threading.Lock()
+        self.reset_counters()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        with self.lock:
+            self.requests = 0
+            self.connections = 0
+            self.images_in_flight = 0
+            self.peak_images_in_flight = 0
+            self.narratives_in_flight = 0
+            self.peak_narratives_in_flight = 0
+            self.narrative_times = []
+
+    def __enter__(self) -> 'MockGenerativeLanguageAPI':
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def story(self, prompt: str) -> dict:
+        """
+        Narrative JSON for a prompt; a prompt mentioning "fail scene" yields one failing scene
+        """
+        failing = "fail scene" in prompt.lower()
+        return {
+            "title": "Mock Story",
+            "narrative": "Once upon a time in a \"mocked\" universe \u2014 caf\u00e9 life.\n" * 20,
+            "scenes": [
+                {"description": f"{'FAIL ' if failing and i == 1 else ''}Scene {i + 1} of the mock story"}
+                for i in range(self.scenes)
+            ],
+        }
+
+    def _handler_class(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # headers and body are separate writes
+
+            def setup(self):
+                super().setup()
+                with api.lock:
+                    api.connections += 1
+
+            def log_message(self, format, *args):
+                pass
+
+            def send_json(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                with api.lock:
+                    api.requests += 1
+                if ':streamGenerateContent' in self.path:
+                    self.stream(payload["contents"][0]["parts"][0]["text"])
+                elif ':generateContent' in self.path:
+                    with api.lock:
+                        api.narrative_times.append(time.perf_counter())
+                        api.narratives_in_flight += 1
+                        api.peak_narratives_in_flight = max(api.peak_narratives_in_flight, api.narratives_in_flight)
+                    try:
+                        time.sleep(api.narrative_latency)
+                    finally:
+                        with api.lock:
+                            api.narratives_in_flight -= 1
+                    prompt = payload["contents"][0]["parts"][0]["text"]
+                    text = json.dumps(api.story(prompt))
+                    self.send_json(200, {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+                elif ':predict' in self.path:
+                    self.predict(payload["instances"]["prompt"])
+                else:
+                    self.send_json(404, {"error": {"message": f"Unknown endpoint {self.path}"}})
+
+            def stream(self, prompt: str, chunks: int = 20) -> None:
+                text = json.dumps(api.story(prompt), ensure_ascii=False)
+                size = -(-len(text) // chunks)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for start in range(0, len(text), size):
+                    time.sleep(api.narrative_latency / chunks)
+                    event = {"candidates": [{"content": {"parts": [{"text": text[start:start + size]}]}}]}
+                    data = f"data: {json.dumps(event)}\r\n\r\n".encode()
+                    self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def predict(self, prompt: str) -> None:
+                with api.lock:
+                    api.images_in_flight += 1
+                    api.peak_images_in_flight = max(api.peak_images_in_flight, api.images_in_flight)
+                try:
+                    time.sleep(api.image_latency)
+                finally:
+                    with api.lock:
+                        api.images_in_flight -= 1
+                if "FAIL" in prompt:
+                    self.send_json(500, {"error": {"message": "Image generation failed"}})
+                else:
+                    encoded = base64.b64encode(FAKE_IMAGE_BYTES).decode()
+                    self.send_json(200, {"predictions": [{"bytesBase64Encoded": encoded}]})
+
+        return Handler
+
+def time_call(func: Callable, repeat: int = 3) -> float:
+    """
+    Best-of-``repeat`` wall time of ``func()`` in seconds
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+# --- Benchmarks ---
+
+def benchmark_concurrent_scenes(api: MockGenerativeLanguageAPI) -> Dict[str, float]:
+    """
+    Story latency with one image at a time against concurrent scene images;
+    also checks that a failing scene still yields its per-scene error
+    """
+    def story(limit, scenario="What if it were mocked?"):
+        return mini_prj.generate_what_if_story_full("Inception", scenario, "test-key",
+                                                    max_concurrent_images=limit, use_cache=False)
+
+    sequential = time_call(lambda: story(1), repeat=1)
+    api.reset_counters()
+    concurrent = time_call(lambda: story(mini_prj.MAX_CONCURRENT_IMAGES), repeat=1)
+    peak = api.peak_images_in_flight
+
+    result = story(mini_prj.MAX_CONCURRENT_IMAGES, "What if a fail scene happened?")
+    scenes = result["data"]["scenes"]
+    errors_kept = (result["success"] and scenes[1]["image_base64"] is None and "error" in scenes[1]
+                   and all(scene["image_base64"] for i, scene in enumerate(scenes) if i != 1))
+    return {
+        'sequential_seconds': sequential,
+        'concurrent_seconds': concurrent,
+        'expected_seconds': api.narrative_latency + api.image_latency,
+        'speedup': sequential / concurrent if concurrent > 0 else 0.0,
+        'peak_images_in_flight': float(peak),
+        'per_scene_errors_kept': float(errors_kept),
+    }
+
+def _latencies(call: Callable, count: int) -> List[float]:
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def benchmark_connection_reuse(api: MockGenerativeLanguageAPI, calls: int = 200) -> Dict[str, float]:
+    """
+    Per-call latency of bare ``requests.post`` (new connection per call)
+    against the pooled session, with the mock's image latency set to zero
+    """
+    url = f"{api.url}/models/imagen-3.0-generate-002:predict?key=test-key"
+    payload = {"instances": {"prompt": "A quick scene"}, "parameters": {"sampleCount": 1}}
+    image_latency, api.image_latency = api.image_latency, 0.0
+    try:
+        api.reset_counters()
+        bare = _latencies(lambda: requests.post(url, headers={'Content-Type': 'application/json'}, json=payload), calls)
+        bare_connections = api.connections
+
+        session = mini_prj.create_session()
+        api.reset_counters()
+        pooled = _latencies(lambda: mini_prj._post_json(url, payload, session), calls)
+        pooled_connections = api.connections
+        session.close()
+    finally:
+        api.image_latency = image_latency
+    return {
+        'calls': float(calls),
+        'bare_p50_ms': statistics.median(bare) * 1000,
+        'pooled_p50_ms': statistics.median(pooled) * 1000,
+        'bare_connections': float(bare_connections),
+        'pooled_connections': float(pooled_connections),
+    }
+
+def benchmark_cache(api: MockGenerativeLanguageAPI) -> Dict[str, float]:
+    """
+    Cold story against a repeat (differently spaced and cased) prompt served
+    from memory, then from the disk tier of a fresh cache on the same directory
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        cache = mini_prj.GenerationCache(directory)
+
+        def story(title, cache):
+            return mini_prj.generate_what_if_story_full(title, "What if it were mocked?", "test-key", cache=cache)
+
+        cold = time_call(lambda: story("Inception", cache), repeat=1)
+        api.reset_counters()
+        warm = time_call(lambda: story("  inception ", cache), repeat=1)
+        warm_requests = api.requests
+        restarted = mini_prj.GenerationCache(directory)
+        disk = time_call(lambda: story("INCEPTION", restarted), repeat=1)
+        same = story("Inception", cache)["data"] == story("inception", restarted)["data"]
+
+        image = story("Inception", cache)["data"]["scenes"][0]["image_base64"]
+        stored = restarted.get(mini_prj.image_cache_key("Scene 1 of the mock story"))
+
+        evicting = mini_prj.GenerationCache(tempfile.mkdtemp(dir=directory), max_disk_bytes=3 * len(stored))
+        for i in range(10):
+            evicting.put(f"key-{i}", stored)
+        return {
+            'cold_seconds': cold,
+            'memory_hit_seconds': warm,
+            'disk_hit_seconds': disk,
+            'requests_on_hit': float(warm_requests),
+            'same_story': float(same),
+            'base64_bytes': float(len(image)),
+            'stored_bytes': float(len(stored)),
+            'entries_after_eviction': float(len(evicting._disk)),
+        }
+
+def benchmark_streaming(api: MockGenerativeLanguageAPI) -> Dict[str, float]:
+    """
+    Time to first byte (title / narrative), first image and completion of the
+    streaming variant, against the blocking generate_what_if_story_full
+    """
+    blocking_result = {}
+
+    def blocking():
+        blocking_result.update(mini_prj.generate_what_if_story_full(
+            "Inception", "What if it were mocked?", "test-key", use_cache=False))
+
+    blocking_seconds = time_call(blocking, repeat=1)
+
+    start = time.perf_counter()
+    first = {}
+    narrative = []
+    for event in mini_prj.generate_what_if_story_stream("Inception", "What if it were mocked?", "test-key",
+                                                        use_cache=False):
+        first.setdefault(event["type"], time.perf_counter() - start)
+        if event["type"] == "narrative":
+            narrative.append(event["text"])
+        elif event["type"] == "done":
+            result = event["result"]
+    total = time.perf_counter() - start
+    return {
+        'blocking_seconds': blocking_seconds,
+        'first_title_seconds': first['title'],
+        'first_narrative_seconds': first['narrative'],
+        'first_scene_seconds': first['scene'],
+        'first_image_seconds': first['image'],
+        'stream_total_seconds': total,
+        'same_result': float(result == blocking_result and "".join(narrative) == result["data"]["narrative"]),
+    }
+
+# Slack on the observed narrative rate for arrival-time jitter at the mock server
+RATE_TOLERANCE = 0.01
+
+def _peak_per_second(times: List[float]) -> int:
+    """
+    Most arrivals within any one-second window
+    """
+    peak, start = 0, 0
+    for end, arrival in enumerate(times):
+        while arrival - times[start] >= 1.0:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return peak
+
+def benchmark_batch(api: MockGenerativeLanguageAPI, stories: int = 300, narrative_rate: float = 100.0) -> Dict[str, float]:
+    """
+    Batch runner over a CSV of stories with latencies cut to 50ms: throughput,
+    per-endpoint concurrency caps and narrative rate against the limits, and a
+    resume after an interrupted run (a partial last line included)
+
+    ``within_rate_limit`` is 0 when the average narrative rate exceeds the
+    limit (beyond RATE_TOLERANCE) or any one-second window holds more than
+    limit + burst requests, the most a token bucket may let through.
+    """
+    latencies = api.narrative_latency, api.image_latency
+    api.narrative_latency = api.image_latency = 0.05
+    limits = {'narrative_concurrency': 8, 'image_concurrency': 16, 'narrative_rate': narrative_rate}
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'stories.csv')
+            sink_path = os.path.join(directory, 'stories.jsonl')
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['movie_title', 'what_if_scenario'])
+                for i in range(stories):
+                    writer.writerow([f"Movie {i}", f"What if scenario {i} happened?"])
+
+            # Interrupted run: the first third, then a torn line
+            first = list(mini_prj.read_story_requests(csv_path))[:stories // 3]
+            asyncio.run(mini_prj.generate_story_batch_async(first, sink_path, 'test-key', use_cache=False, **limits))
+            with open(sink_path, 'a', encoding='utf-8') as f:
+                f.write('{"index": 999999, "trunc')
+
+            api.reset_counters()
+            stats = mini_prj.generate_story_batch(csv_path, sink_path, 'test-key', ordered=True, use_cache=False, **limits)
+            times = api.narrative_times
+            rate = (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 else 0.0
+            peak_second = _peak_per_second(sorted(times))
+            with open(sink_path, encoding='utf-8') as f:
+                indices = [json.loads(line)['index'] for line in f]
+            resumed = indices[stories // 3:]
+    finally:
+        api.narrative_latency, api.image_latency = latencies
+    return {
+        'stories': float(stories),
+        'written': float(stats['written']),
+        'skipped': float(stats['skipped']),
+        'stories_per_second': stats['written'] / stats['seconds'],
+        'narrative_rate_limit': narrative_rate,
+        'narrative_rate_observed': rate,
+        'narrative_peak_per_second': float(peak_second),
+        'within_rate_limit': float(rate <= narrative_rate * (1 + RATE_TOLERANCE)
+                                   and peak_second <= narrative_rate + mini_prj.BATCH_BURST),
+        'peak_narratives_in_flight': float(api.peak_narratives_in_flight),
+        'peak_images_in_flight': float(api.peak_images_in_flight),
+        'complete_and_unique': float(sorted(indices) == list(range(stories))),
+        'resumed_in_order': float(resumed == sorted(resumed)),
+    }
+
+BENCHMARKS = {
+    'concurrent_scenes': benchmark_concurrent_scenes,
+    'connection_reuse': benchmark_connection_reuse,
+    'cache': benchmark_cache,
+    'streaming': benchmark_streaming,
+    'batch': benchmark_batch,
+}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark mini_prj against a local mock of the generativelanguage API.")
+    parser.add_argument('--narrative-latency', type=float, default=0.2, help="mock narrative latency in seconds (default: 0.2)")
+    parser.add_argument('--image-latency', type=float, default=0.5, help="mock image latency in seconds (default: 0.5)")
+    parser.add_argument('--scenes', type=int, default=3, help="scenes per mock story (default: 3)")
+    parser.add_argument('--only', choices=sorted(BENCHMARKS), action='append', help="run only these benchmarks")
+    parser.add_argument('-o', '--output', default='mini_prj_benchmark.json', help="where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    report = {'narrative_latency': args.narrative_latency, 'image_latency': args.image_latency, 'results': {}}
+    with MockGenerativeLanguageAPI(args.narrative_latency, args.image_latency, args.scenes) as api:
+        mini_prj.API_BASE_URL = api.url
+        for name in args.only or BENCHMARKS:
+            api.reset_counters()
+            result = BENCHMARKS[name](api)
+            report['results'][name] = result
+            summary = ', '.join(f"{metric}={value:.4g}" for metric, value in result.items())
+            print(f"{name:<30} {summary}")
+
+    with open(args.output, 'w', encoding='utf-8') as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nReport written to {args.output}")
+
+    batch = report['results'].get('batch')
+    if batch is not None and not batch['within_rate_limit']:
+        print(f"Rate limit exceeded: {batch['narrative_rate_observed']:.1f}/s observed, "
+              f"{batch['narrative_peak_per_second']:.0f} in one second (limit {batch['narrative_rate_limit']:.0f}/s)")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())